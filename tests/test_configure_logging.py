@@ -0,0 +1,42 @@
+"""Tests for configure_logging's file sink bookkeeping."""
+
+import pytest
+from loguru import logger
+
+import voicetype.__main__ as main_mod
+
+
+@pytest.fixture
+def reset_logging():
+    """Start without a file sink and remove any sink a test adds."""
+    main_mod._configured_log_file = None
+    main_mod._log_sink_id = None
+    yield
+    if main_mod._log_sink_id is not None:
+        logger.remove(main_mod._log_sink_id)
+    main_mod._configured_log_file = None
+    main_mod._log_sink_id = None
+
+
+class TestConfigureLogging:
+    def test_same_file_adds_one_sink(self, reset_logging, tmp_path):
+        log_file = tmp_path / "voicetype.log"
+        main_mod.configure_logging(log_file)
+        sink_id = main_mod._log_sink_id
+
+        assert main_mod.configure_logging(log_file) == log_file
+        assert main_mod._log_sink_id == sink_id
+
+        logger.info("written once")
+        assert log_file.read_text().count("written once") == 1
+
+    def test_new_file_replaces_sink(self, reset_logging, tmp_path):
+        first = tmp_path / "first.log"
+        second = tmp_path / "sub" / "second.log"
+        main_mod.configure_logging(first)
+
+        assert main_mod.configure_logging(second) == second
+
+        logger.info("after switch")
+        assert "after switch" in second.read_text()
+        assert "after switch" not in first.read_text()
@@ -2,12 +2,13 @@
 
 import threading
 from typing import Optional
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from voicetype.pipeline import (
     HotkeyDispatcher,
+    HotkeyTriggerEvent,
     PipelineManager,
     ResourceManager,
 )
@@ -170,10 +171,16 @@ def test_full_integration_mock():
     hotkey_string = "<pause>"
 
     # Press
-    hotkey_dispatcher._on_press(hotkey_string)
-
-    # Verify trigger event created
-    assert hotkey_string in hotkey_dispatcher.active_events
+    with patch.object(
+        pipeline_manager, "trigger_pipeline", wraps=pipeline_manager.trigger_pipeline
+    ) as trigger_pipeline:
+        hotkey_dispatcher._on_press(hotkey_string)
+
+    # Verify a trigger event was created and handed to the pipeline. The
+    # dispatcher's own entry may already be gone if the pipeline ended early
+    # (e.g. no audio device), so check the event the pipeline received.
+    trigger_pipeline.assert_called_once()
+    assert isinstance(trigger_pipeline.call_args.args[1], HotkeyTriggerEvent)
 
     # Release
     hotkey_dispatcher._on_release(hotkey_string)
@@ -7,8 +7,10 @@ from typing import Optional
 import pytest
 
 from voicetype.pipeline import (
+    HotkeyDispatcher,
     HotkeyTriggerEvent,
     PipelineContext,
+    PipelineExecutor,
     ProgrammaticTriggerEvent,
     Resource,
     ResourceManager,
@@ -73,6 +75,25 @@ class TestTriggerEvents:
         assert result is True
         assert elapsed < 0.2  # Should timeout before full duration
 
+    def test_timer_trigger_interrupt_ends_wait(self):
+        """Test interrupting a timer trigger wakes the waiter early."""
+        trigger = TimerTriggerEvent(duration=5.0)
+        threading.Timer(0.05, trigger.interrupt).start()
+
+        start_time = time.time()
+        result = trigger.wait_for_completion()
+        elapsed = time.time() - start_time
+
+        assert result is True
+        assert elapsed < 1.0
+
+    def test_hotkey_trigger_interrupt_ends_wait(self):
+        """Test interrupting a hotkey trigger wakes the waiter early."""
+        trigger = HotkeyTriggerEvent()
+        trigger.interrupt()
+
+        assert trigger.wait_for_completion(timeout=1.0) is True
+
     def test_programmatic_trigger_returns_immediately(self):
         """Test programmatic trigger returns immediately."""
         trigger = ProgrammaticTriggerEvent()
@@ -85,6 +106,70 @@ class TestTriggerEvents:
         assert elapsed < 0.01  # Should be nearly instant
 
 
+class TestHotkeyDispatcher:
+    """Test HotkeyDispatcher press/release bookkeeping."""
+
+    class _FakePipelineManager:
+        def __init__(self):
+            self.triggers = []
+
+        def get_pipeline_by_hotkey(self, hotkey):
+            return type("Pipeline", (), {"name": "default"})()
+
+        def trigger_pipeline(self, name, trigger_event):
+            self.triggers.append(trigger_event)
+            return "pipeline-id"
+
+    def test_repeated_press_keeps_original_trigger(self):
+        """A second press while active must not orphan the first trigger."""
+        manager = self._FakePipelineManager()
+        dispatcher = HotkeyDispatcher(manager)
+
+        dispatcher._on_press("<pause>")
+        dispatcher._on_press("<pause>")  # e.g. key auto-repeat
+
+        assert len(manager.triggers) == 1
+        dispatcher._on_release("<pause>")
+        assert manager.triggers[0].wait_for_completion(timeout=0)
+        assert "<pause>" not in dispatcher.active_events
+
+    def test_lost_release_does_not_block_next_press(self):
+        """Once the pipeline ends, a press starts a new one even without a release."""
+        manager = self._FakePipelineManager()
+        dispatcher = HotkeyDispatcher(manager)
+
+        dispatcher._on_press("<pause>")
+        # The release never arrives; the pipeline ends (e.g. max_duration)
+        manager.triggers[0].pipeline_finished()
+        dispatcher._on_press("<pause>")
+
+        assert len(manager.triggers) == 2
+        assert dispatcher.active_events["<pause>"] is manager.triggers[1]
+
+    def test_stale_finish_keeps_newer_trigger(self):
+        """A finished pipeline only forgets its own trigger."""
+        manager = self._FakePipelineManager()
+        dispatcher = HotkeyDispatcher(manager)
+
+        dispatcher._on_press("<pause>")
+        dispatcher._on_release("<pause>")
+        dispatcher._on_press("<pause>")
+        manager.triggers[0].pipeline_finished()
+
+        assert dispatcher.active_events["<pause>"] is manager.triggers[1]
+
+    def test_executor_reports_pipeline_end_to_trigger(self):
+        """The executor notifies the trigger when the pipeline completes."""
+        finished = threading.Event()
+        executor = PipelineExecutor(ResourceManager(), MockIconController())
+        try:
+            trigger = HotkeyTriggerEvent(on_finished=finished.set)
+            assert executor.execute_pipeline("empty", [], trigger) is not None
+            assert finished.wait(timeout=5)
+        finally:
+            executor.shutdown(timeout=5)
+
+
 class MockIconController:
     """Mock icon controller for testing."""
 
@@ -0,0 +1,59 @@
+"""Tests for PynputHotkeyListener's press/release tracking.
+
+Key events are fed to the handlers directly, so no pynput backend is needed.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from voicetype.hotkey_listener.pynput_hotkey_listener import (
+    PynputHotkeyListener,
+    keyboard,
+)
+
+A = keyboard.KeyCode.from_char("a")
+B = keyboard.KeyCode.from_char("b")
+
+
+@pytest.fixture
+def listener():
+    listener = PynputHotkeyListener(
+        on_hotkey_press=MagicMock(), on_hotkey_release=MagicMock()
+    )
+    listener.add_hotkey("a+b")
+    # Stand-in for the running keyboard.Listener, which only canonicalizes keys
+    listener._listener = MagicMock(canonical=lambda key: key)
+    return listener
+
+
+class TestKeyTracking:
+    def test_combo_press_and_release(self, listener):
+        listener._on_key_press(A)
+        listener.on_hotkey_press.assert_not_called()
+        listener._on_key_press(B)
+        listener.on_hotkey_press.assert_called_once_with("a+b")
+
+        # Released once the last key of the combo goes up
+        listener._on_key_release(B)
+        listener.on_hotkey_release.assert_not_called()
+        listener._on_key_release(A)
+        listener.on_hotkey_release.assert_called_once_with("a+b")
+        assert listener._pressed_keys == set()
+
+    def test_auto_repeat_does_not_retrigger(self, listener):
+        for _ in range(3):
+            listener._on_key_press(A)
+            listener._on_key_press(B)
+
+        listener.on_hotkey_press.assert_called_once_with("a+b")
+        assert listener._pressed_keys == {A, B}
+
+    def test_repress_after_release_triggers_again(self, listener):
+        for _ in range(2):
+            listener._on_key_press(A)
+            listener._on_key_press(B)
+            listener._on_key_release(B)
+            listener._on_key_release(A)
+
+        assert listener.on_hotkey_press.call_count == 2
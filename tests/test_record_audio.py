@@ -0,0 +1,291 @@
+"""Tests for the RecordAudio stage's device handling, audio callback and filters.
+
+sounddevice is patched so these run without any audio hardware.
+"""
+
+import os
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+import voicetype.pipeline.stages.record_audio as record_audio_mod
+from voicetype.pipeline.stages.record_audio import RecordAudio
+
+DEVICES = [
+    {"name": "Speakers", "max_input_channels": 0, "default_samplerate": 48000.0},
+    {"name": "USB Mic", "max_input_channels": 1, "default_samplerate": 44100.0},
+]
+
+
+@pytest.fixture
+def query_devices(monkeypatch):
+    """Patch sd.query_devices with a fake device list and clear the cache."""
+
+    def fake(device=None, kind=None):
+        if kind is None:
+            return DEVICES
+        return DEVICES[1] if device is None else DEVICES[device]
+
+    mock = MagicMock(side_effect=fake)
+    monkeypatch.setattr(record_audio_mod.sd, "query_devices", mock, raising=False)
+    # By default the device only runs at its native rate
+    monkeypatch.setattr(
+        record_audio_mod.sd,
+        "check_input_settings",
+        MagicMock(side_effect=record_audio_mod.sd.PortAudioError("unsupported")),
+        raising=False,
+    )
+    record_audio_mod._DEVICE_CACHE.clear()
+    yield mock
+    record_audio_mod._DEVICE_CACHE.clear()
+
+
+class TestDeviceCache:
+    def test_device_probed_once_across_instances(self, query_devices, tmp_path):
+        cfg = {"device_name": "usb", "audio_storage_path": str(tmp_path)}
+        first = RecordAudio(cfg)
+        calls = query_devices.call_count
+        second = RecordAudio(cfg)
+
+        assert query_devices.call_count == calls
+        assert (first.device_id, first.sample_rate) == (1, 44100)
+        assert (second.device_id, second.sample_rate) == (1, 44100)
+
+    def test_named_device_enumerates_once(self, query_devices, tmp_path):
+        RecordAudio({"device_name": "usb", "audio_storage_path": str(tmp_path)})
+
+        query_devices.assert_called_once_with()
+
+    def test_cache_is_keyed_by_device_name(self, query_devices, tmp_path):
+        RecordAudio({"audio_storage_path": str(tmp_path)})
+        stage = RecordAudio({"device_name": "usb", "audio_storage_path": str(tmp_path)})
+
+        assert stage.device_id == 1
+        assert set(record_audio_mod._DEVICE_CACHE) == {None, "usb"}
+
+    def test_prefers_whisper_sample_rate(self, query_devices, tmp_path, monkeypatch):
+        check = MagicMock()
+        monkeypatch.setattr(
+            record_audio_mod.sd, "check_input_settings", check, raising=False
+        )
+        stage = RecordAudio({"device_name": "usb", "audio_storage_path": str(tmp_path)})
+
+        assert stage.sample_rate == 16000
+        assert check.call_args.kwargs["samplerate"] == 16000
+        assert check.call_args.kwargs["device"] == 1
+
+    def test_failed_stream_open_forgets_device(
+        self, query_devices, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr(
+            record_audio_mod.sd,
+            "InputStream",
+            MagicMock(side_effect=record_audio_mod.sd.PortAudioError("gone")),
+            raising=False,
+        )
+        stage = RecordAudio({"device_name": "usb", "audio_storage_path": str(tmp_path)})
+
+        with pytest.raises(record_audio_mod.SoundDeviceError):
+            stage._start_recording()
+        assert "usb" not in record_audio_mod._DEVICE_CACHE
+
+
+@pytest.fixture
+def input_stream(monkeypatch):
+    """Patch sd.InputStream so recordings start without a real device."""
+    mock = MagicMock()
+    monkeypatch.setattr(record_audio_mod.sd, "InputStream", mock, raising=False)
+    return mock
+
+
+class TestCallback:
+    def test_rms_matches_reference(self, query_devices, input_stream, tmp_path):
+        stage = RecordAudio({"audio_storage_path": str(tmp_path)})
+        stage._start_recording()
+        block = np.random.default_rng(0).integers(-32768, 32767, (512, 1), np.int16)
+
+        stage._callback(block, len(block), None, None)
+
+        expected = float(np.sqrt(np.mean((block / 32768.0) ** 2)))
+        assert stage.max_rms == pytest.approx(expected, rel=1e-5)
+        assert stage.min_rms == pytest.approx(expected, rel=1e-5)
+
+    def test_level_tracks_running_range(self, query_devices, input_stream, tmp_path):
+        stage = RecordAudio({"audio_storage_path": str(tmp_path)})
+        stage._start_recording()
+        quiet = np.full((256, 1), 328, dtype=np.int16)
+        loud = np.full((256, 1), 16384, dtype=np.int16)
+
+        stage._callback(quiet, 256, None, None)
+        assert stage.pct == 0.5  # no range yet
+        stage._callback(loud, 256, None, None)
+        assert stage.pct == pytest.approx(1.0)
+        stage._callback(quiet, 256, None, None)
+        assert stage.pct == pytest.approx(0.0)
+        assert stage.min_rms == pytest.approx(328 / 32768)
+        assert stage.max_rms == pytest.approx(0.5)
+
+    def test_recording_rms_covers_whole_take(
+        self, query_devices, input_stream, tmp_path
+    ):
+        stage = RecordAudio({"audio_storage_path": str(tmp_path)})
+        stage._start_recording()
+        assert stage.recording_rms == 0.0
+        assert stage.pct == 0.0
+
+        stage._callback(np.full((100, 1), 16384, dtype=np.int16), 100, None, None)
+        stage._callback(np.zeros((300, 1), dtype=np.int16), 300, None, None)
+
+        # mean square = (100 * 0.5**2) / 400
+        assert stage.recording_rms == pytest.approx(0.25)
+
+    def test_blocks_captured_into_recording(
+        self, query_devices, input_stream, tmp_path
+    ):
+        stage = RecordAudio({"audio_storage_path": str(tmp_path)})
+        blocks = [np.full((256, 1), i * 3000, dtype=np.int16) for i in range(3)]
+
+        stage._start_recording()
+        for block in blocks:
+            stage._callback(block, len(block), None, None)
+        recording, _ = stage._stop_recording()
+
+        expected = np.concatenate(blocks).reshape(-1) / np.float32(32768)
+        assert recording.samples.dtype == np.float32
+        np.testing.assert_array_equal(recording.samples, expected)
+        assert recording.sample_rate == 44100
+        assert input_stream.call_args.kwargs["dtype"] == "int16"
+
+        # The file is written by default, even when it is cleaned up later
+        written, rate = sf.read(recording.path, dtype="float32")
+        assert rate == 44100
+        assert sf.info(recording.path).subtype == "PCM_16"
+        np.testing.assert_array_equal(written, expected)
+
+    def test_in_memory_only_defers_file(self, query_devices, input_stream, tmp_path):
+        stage = RecordAudio(
+            {"audio_storage_path": str(tmp_path), "in_memory_only": True}
+        )
+        blocks = [np.full((256, 1), i * 3000, dtype=np.int16) for i in range(3)]
+
+        stage._start_recording()
+        for block in blocks:
+            stage._callback(block, len(block), None, None)
+        recording, _ = stage._stop_recording()
+
+        expected = np.concatenate(blocks).reshape(-1) / np.float32(32768)
+        np.testing.assert_array_equal(recording.samples, expected)
+
+        # The file is only written when a stage asks for it
+        assert not os.path.exists(recording.path)
+        recording.ensure_file()
+        written, _ = sf.read(recording.path, dtype="float32")
+        np.testing.assert_array_equal(written, expected)
+
+    def test_kept_recordings_written_despite_in_memory_only(
+        self, query_devices, input_stream, tmp_path
+    ):
+        stage = RecordAudio(
+            {
+                "audio_storage_path": str(tmp_path),
+                "in_memory_only": True,
+                "cleanup_audio_files": False,
+            }
+        )
+
+        stage._start_recording()
+        stage._callback(np.ones((256, 1), dtype=np.int16), 256, None, None)
+        recording, _ = stage._stop_recording()
+
+        assert os.path.exists(recording.path)
+
+    def test_writer_thread_writes_during_capture(
+        self, query_devices, input_stream, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr(record_audio_mod, "WRITER_INTERVAL_SECONDS", 0.01)
+        stage = RecordAudio(
+            {"audio_storage_path": str(tmp_path), "cleanup_audio_files": False}
+        )
+        block = np.full((256, 1), 8192, dtype=np.int16)
+
+        stage._start_recording()
+        stage._callback(block, len(block), None, None)
+        deadline = time.monotonic() + 5
+        while stage._written < 256 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        written_while_recording = stage._written
+        recording, _ = stage._stop_recording()
+
+        assert written_while_recording == 256
+        assert stage._writer is None
+        np.testing.assert_array_equal(
+            sf.read(recording.path, dtype="int16")[0],
+            np.full(256, 8192, dtype=np.int16),
+        )
+
+
+class TestSilenceFilter:
+    @pytest.fixture
+    def record(self, query_devices, input_stream, tmp_path):
+        """Run execute() with ``block`` as the only audio the stream delivers."""
+
+        def run(block, **config):
+            stage = RecordAudio(
+                {"audio_storage_path": str(tmp_path), "minimum_duration": 0, **config}
+            )
+            context = SimpleNamespace(
+                cancel_requested=threading.Event(),
+                icon_controller=MagicMock(),
+                trigger_event=MagicMock(),
+                recorded_audio=None,
+            )
+            # The trigger "completes" once the block has arrived
+            context.trigger_event.wait_for_completion.side_effect = (
+                lambda timeout: stage._callback(block, len(block), None, None)
+            )
+            return stage, context, stage.execute(None, context)
+
+        return run
+
+    def test_silent_recording_filtered_out(self, record):
+        stage, context, path = record(np.zeros((1600, 1), dtype=np.int16))
+        assert path is None
+        assert context.recorded_audio is None
+        # Still handed to cleanup
+        assert stage.current_recording is not None
+
+    def test_speech_level_recording_kept(self, record):
+        _, context, path = record(np.full((1600, 1), 3277, dtype=np.int16))
+        assert path is not None
+        assert context.recorded_audio.path == path
+        assert len(context.recorded_audio.samples) == 1600
+
+    def test_threshold_zero_disables_filter(self, record):
+        _, _, path = record(np.zeros((1600, 1), dtype=np.int16), silence_threshold=0)
+        assert path is not None
+
+
+class TestCleanup:
+    def test_removes_written_recording(self, query_devices, tmp_path):
+        stage = RecordAudio({"audio_storage_path": str(tmp_path)})
+        recording = tmp_path / "rec.wav"
+        recording.write_bytes(b"RIFF")
+        stage.current_recording = str(recording)
+
+        stage.cleanup()
+
+        assert not recording.exists()
+        assert stage.current_recording is None
+
+    def test_forgets_recording_never_written(self, query_devices, tmp_path):
+        stage = RecordAudio({"audio_storage_path": str(tmp_path)})
+        stage.current_recording = str(tmp_path / "rec.wav")
+
+        stage.cleanup()
+
+        assert stage.current_recording is None
@@ -1,8 +1,11 @@
 """Tests for Transcribe stage configuration validation."""
 
+from unittest.mock import patch
+
 import pytest
 from pydantic import ValidationError
 
+import voicetype.pipeline.stages.transcribe as transcribe_mod
 from voicetype.pipeline.stages.transcribe import (
     LiteLLMSTTRuntime,
     LocalSTTRuntime,
@@ -20,6 +23,8 @@ class TestSTTRuntimeConfig:
         assert runtime.provider == "local"
         assert runtime.model == "tiny"
         assert runtime.device == "cpu"
+        assert runtime.beam_size == 1
+        assert runtime.vad_filter is False
 
     def test_local_runtime_custom_values(self):
         """Test LocalSTTRuntime with custom values."""
@@ -186,3 +191,39 @@ class TestTranscribeStageInit:
         )
         assert stage.cfg.language == "ja"
         assert stage.cfg.download_root == "/custom/models"
+
+
+class TestPreimportRuntimeModules:
+    """Startup pre-imports only the libraries the configured runtimes use."""
+
+    def _preimport(self, *stage_configs, side_effect=None):
+        with patch.object(
+            transcribe_mod.importlib, "import_module", side_effect=side_effect
+        ) as import_module:
+            transcribe_mod.preimport_runtime_modules(list(stage_configs))
+        return [c.args[0] for c in import_module.call_args_list]
+
+    def test_local_only_skips_litellm(self):
+        cfg = {"stage": "Transcribe", "runtime": {"provider": "local"}}
+        assert self._preimport(cfg, cfg) == ["faster_whisper"]
+
+    def test_litellm_only_skips_faster_whisper(self):
+        cfg = {"stage": "Transcribe", "runtime": {"provider": "litellm"}}
+        assert self._preimport(cfg) == ["litellm"]
+
+    def test_fallback_runtimes_included(self):
+        cfg = {
+            "stage": "Transcribe",
+            "runtime": {"provider": "local"},
+            "fallback_runtimes": [{"provider": "litellm"}],
+        }
+        assert self._preimport(cfg) == ["faster_whisper", "litellm"]
+
+    def test_missing_library_is_skipped(self):
+        cfg = {
+            "stage": "Transcribe",
+            "runtime": {"provider": "local"},
+            "fallback_runtimes": [{"provider": "litellm"}],
+        }
+        imported = self._preimport(cfg, side_effect=ImportError("not installed"))
+        assert imported == ["faster_whisper", "litellm"]
@@ -0,0 +1,107 @@
+"""Tests for the LiteLLM upload path, including converting large recordings."""
+
+import sys
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+import voicetype.pipeline.stages.transcribe as transcribe_mod
+from voicetype.pipeline.stages.record_audio import RecordedAudio
+from voicetype.pipeline.stages.transcribe import Transcribe, TranscriptionError
+
+
+class TestConvertAudioFile:
+    def test_uses_ffmpeg_when_available(self):
+        with (
+            patch.object(transcribe_mod.shutil, "which", return_value="/bin/ffmpeg"),
+            patch.object(transcribe_mod.subprocess, "run") as run,
+            patch.object(transcribe_mod, "AudioSegment") as audio_segment,
+        ):
+            transcribe_mod._convert_audio_file("in.wav", "out.mp3", "mp3")
+
+        cmd = run.call_args.args[0]
+        assert cmd[0] == "/bin/ffmpeg"
+        assert cmd[cmd.index("-i") + 1] == "in.wav"
+        assert cmd[-1] == "out.mp3"
+        assert run.call_args.kwargs["check"] is True
+        audio_segment.from_wav.assert_not_called()
+
+    def test_falls_back_to_pydub_without_ffmpeg(self):
+        segment = MagicMock()
+        with (
+            patch.object(transcribe_mod.shutil, "which", return_value=None),
+            patch.object(transcribe_mod.subprocess, "run") as run,
+            patch.object(transcribe_mod, "AudioSegment") as audio_segment,
+        ):
+            audio_segment.from_wav.return_value = segment
+            transcribe_mod._convert_audio_file("in.wav", "out.mp3", "mp3")
+
+        run.assert_not_called()
+        audio_segment.from_wav.assert_called_once_with("in.wav")
+        segment.export.assert_called_once_with("out.mp3", format="mp3")
+
+    def test_recorded_audio_encoded_in_process(self, tmp_path):
+        av = pytest.importorskip("av")
+        samples = np.zeros(16000, dtype=np.float32)
+        dst = str(tmp_path / "out.mp3")
+        with patch.object(transcribe_mod.subprocess, "run") as run:
+            transcribe_mod._convert_audio_file(
+                "missing.wav",
+                dst,
+                "mp3",
+                RecordedAudio("missing.wav", samples, 16000),
+            )
+
+        run.assert_not_called()
+        with av.open(dst) as container:
+            assert container.format.name == "mp3"
+            assert container.streams.audio[0].rate == 16000
+
+
+class TestLiteLLMUpload:
+    @pytest.fixture
+    def stage(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        return Transcribe(config={"runtime": {"provider": "litellm"}})
+
+    def test_missing_file_raises(self, stage, tmp_path):
+        with pytest.raises(TranscriptionError, match="not found"):
+            stage._transcribe_with_litellm_runtime(
+                str(tmp_path / "missing.wav"), stage.cfg.runtime
+            )
+
+    def test_small_wav_uploaded_without_conversion(self, stage, tmp_path):
+        wav = tmp_path / "rec.wav"
+        wav.write_bytes(b"RIFF")
+        litellm = MagicMock()
+        litellm.transcription.return_value.text = " hello "
+
+        with (
+            patch.dict(sys.modules, {"litellm": litellm}),
+            patch.object(transcribe_mod, "_convert_audio_file") as convert,
+        ):
+            text = stage._transcribe_with_litellm_runtime(str(wav), stage.cfg.runtime)
+
+        assert text == "hello"
+        convert.assert_not_called()
+        assert litellm.transcription.call_args.kwargs["file"].name == str(wav)
+
+    def test_oversized_wav_converted_to_mp3(self, stage, tmp_path):
+        wav = tmp_path / "rec.wav"
+        wav.write_bytes(b"RIFF")
+        litellm = MagicMock()
+        litellm.transcription.return_value.text = "hello"
+
+        with (
+            patch.dict(sys.modules, {"litellm": litellm}),
+            patch.object(transcribe_mod, "MAX_UPLOAD_BYTES", 3),
+            patch.object(transcribe_mod, "_convert_audio_file") as convert,
+        ):
+            stage._transcribe_with_litellm_runtime(str(wav), stage.cfg.runtime)
+
+        src, dst, audio_format, recording = convert.call_args.args
+        assert src == str(wav)
+        assert audio_format == "mp3"
+        assert dst.endswith(".mp3")
+        assert recording is None
@@ -0,0 +1,136 @@
+"""Tests for handing RecordAudio's in-memory samples straight to local Whisper.
+
+The model constructor is patched so these run without faster-whisper being
+able to load a real model.
+"""
+
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+import voicetype.pipeline.stages.transcribe as transcribe_mod
+from voicetype.pipeline.stages.record_audio import RecordedAudio
+from voicetype.pipeline.stages.transcribe import Transcribe
+
+
+class FakeModel:
+    """Records what transcribe() was called with."""
+
+    def __init__(self):
+        self.inputs = []
+        self.kwargs = []
+
+    def transcribe(self, audio, **kwargs):
+        self.inputs.append(audio)
+        self.kwargs.append(kwargs)
+        return iter([SimpleNamespace(text=" hello")]), None
+
+
+def _transcribe(filename, recording=None, model=None, **runtime):
+    model = model or FakeModel()
+    cfg = {
+        "runtime": {"provider": "local", "model": "tiny", "device": "cpu", **runtime}
+    }
+    with patch.object(transcribe_mod, "_create_whisper_model", return_value=model):
+        stage = Transcribe(config=cfg)
+        assert stage._model_ready.wait(timeout=10)
+        text = stage._transcribe_single_runtime(filename, stage.cfg.runtime, recording)
+    return text, model.inputs[0]
+
+
+class TestRecordedAudio:
+    def test_ensure_file_writes_samples_once(self, tmp_path):
+        samples = np.array([0.0, 0.5, -0.5], dtype=np.float32)
+        rec = RecordedAudio(str(tmp_path / "sub" / "rec.wav"), samples, 16000)
+
+        rec.ensure_file()
+        mtime = os.stat(rec.path).st_mtime_ns
+        rec.ensure_file()
+
+        assert os.stat(rec.path).st_mtime_ns == mtime
+        data, rate = sf.read(rec.path, dtype="float32")
+        assert rate == 16000
+        np.testing.assert_array_equal(data, samples)
+
+
+class TestInMemoryTranscription:
+    def test_16khz_samples_used_directly(self):
+        samples = np.zeros(16000, dtype=np.float32)
+        text, audio = _transcribe(
+            "/tmp/rec.wav", RecordedAudio("/tmp/rec.wav", samples, 16000)
+        )
+        assert text == "hello"
+        assert audio is samples
+
+    def test_other_rates_resampled_in_memory(self):
+        pytest.importorskip("av")
+        samples = np.zeros(48000, dtype=np.float32)
+        _, audio = _transcribe(
+            "/tmp/rec.wav", RecordedAudio("/tmp/rec.wav", samples, 48000)
+        )
+        assert isinstance(audio, np.ndarray)
+        assert audio.dtype == np.float32
+        assert audio.shape == (16000,)
+
+    def test_resample_failure_falls_back_to_file(self, tmp_path):
+        samples = np.zeros(48000, dtype=np.float32)
+        path = str(tmp_path / "rec.wav")
+        with patch.object(
+            transcribe_mod, "_resample_for_whisper", side_effect=RuntimeError("boom")
+        ):
+            _, audio = _transcribe(path, RecordedAudio(path, samples, 48000))
+        assert audio == path
+        assert os.path.exists(path)
+
+    def test_plain_path_unchanged(self):
+        _, audio = _transcribe("/tmp/rec.wav")
+        assert audio == "/tmp/rec.wav"
+
+
+class TestContextRecording:
+    @pytest.fixture
+    def run(self):
+        """Run execute() with ``recording`` stored on the pipeline context."""
+
+        def run(filename, recording):
+            model = FakeModel()
+            context = SimpleNamespace(
+                icon_controller=MagicMock(), recorded_audio=recording
+            )
+            cfg = {"runtime": {"provider": "local", "model": "tiny", "device": "cpu"}}
+            with patch.object(
+                transcribe_mod, "_create_whisper_model", return_value=model
+            ):
+                stage = Transcribe(config=cfg)
+                assert stage._model_ready.wait(timeout=10)
+                stage.execute(filename, context)
+            return model.inputs[0]
+
+        return run
+
+    def test_samples_for_input_path_used(self, run):
+        samples = np.zeros(16000, dtype=np.float32)
+        audio = run("/tmp/rec.wav", RecordedAudio("/tmp/rec.wav", samples, 16000))
+        assert audio is samples
+
+    def test_samples_for_other_path_ignored(self, run):
+        samples = np.zeros(16000, dtype=np.float32)
+        audio = run("/tmp/other.wav", RecordedAudio("/tmp/rec.wav", samples, 16000))
+        assert audio == "/tmp/other.wav"
+
+
+class TestDecodeOptions:
+    @pytest.mark.parametrize("vad_filter", [False, True])
+    def test_vad_filter_passed_to_model(self, vad_filter):
+        model = FakeModel()
+        _transcribe("/tmp/rec.wav", model=model, vad_filter=vad_filter)
+        assert model.kwargs[0]["vad_filter"] is vad_filter
+
+    def test_beam_size_passed_to_model(self):
+        model = FakeModel()
+        _transcribe("/tmp/rec.wav", model=model, beam_size=5)
+        assert model.kwargs[0]["beam_size"] == 5
@@ -109,6 +109,42 @@ class TestResidentModelCache:
         # Nothing cached when keep_loaded is off.
         assert transcribe_mod._MODEL_CACHE == {}
 
+    def test_resident_model_warmed_up_once(self, clear_model_cache):
+        calls = []
+
+        class FakeModel:
+            def transcribe(self, audio, **kwargs):
+                calls.append((len(audio), kwargs))
+                return iter([]), None
+
+        with patch.object(
+            transcribe_mod, "_create_whisper_model", side_effect=lambda *a: FakeModel()
+        ):
+            s1 = Transcribe(config=self._local_cfg(keep_loaded=True))
+            assert s1._model_ready.wait(timeout=10)
+            s2 = Transcribe(config=self._local_cfg(keep_loaded=True))
+            assert s2._model_ready.wait(timeout=10)
+
+        # One second of 16 kHz audio, greedy decode, no VAD -- and only once.
+        assert calls == [(16000, {"beam_size": 1, "vad_filter": False})]
+
+    @pytest.mark.parametrize(
+        "device, compute_type", [("cpu", "int8"), ("cuda", "int8_float16")]
+    )
+    def test_resident_model_loaded_quantized(
+        self, clear_model_cache, device, compute_type
+    ):
+        with patch.object(
+            transcribe_mod, "_create_whisper_model", side_effect=lambda *a: object()
+        ) as create:
+            cfg = self._local_cfg(keep_loaded=True)
+            cfg["runtime"]["device"] = device
+            stage = Transcribe(config=cfg)
+            assert stage._model_ready.wait(timeout=10)
+
+        assert create.call_args.args[2] == compute_type
+        assert ("tiny", device, compute_type) in transcribe_mod._MODEL_CACHE
+
     def test_cleanup_retains_resident_model(self, clear_model_cache):
         with patch.object(
             transcribe_mod, "_create_whisper_model", side_effect=lambda *a: object()
@@ -140,6 +176,55 @@ class TestResidentModelCache:
         assert transcribe_mod._MODEL_CACHE == {}
 
 
+class TestPreloadResidentModels:
+    """Resident models can be loaded at startup, before any pipeline runs."""
+
+    def _stage_cfg(self, keep_loaded):
+        return {
+            "stage": "Transcribe",
+            "runtime": {
+                "provider": "local",
+                "model": "tiny",
+                "device": "cpu",
+                "keep_loaded": keep_loaded,
+            },
+        }
+
+    def test_loads_only_resident_models(self, clear_model_cache):
+        with patch.object(
+            transcribe_mod, "_create_whisper_model", side_effect=lambda *a: object()
+        ) as create:
+            transcribe_mod.preload_resident_models(
+                [self._stage_cfg(keep_loaded=False), self._stage_cfg(keep_loaded=True)]
+            )
+
+        assert create.call_count == 1
+        assert list(transcribe_mod._MODEL_CACHE) == [("tiny", "cpu", "int8")]
+
+    def test_stage_reuses_preloaded_model(self, clear_model_cache):
+        with patch.object(
+            transcribe_mod, "_create_whisper_model", side_effect=lambda *a: object()
+        ) as create:
+            transcribe_mod.preload_resident_models([self._stage_cfg(keep_loaded=True)])
+            stage = Transcribe(config=self._stage_cfg(keep_loaded=True))
+            assert stage._model_ready.wait(timeout=10)
+
+        assert create.call_count == 1
+        assert stage._preloaded_model is next(
+            iter(transcribe_mod._MODEL_CACHE.values())
+        )
+
+    def test_errors_are_logged_not_raised(self, clear_model_cache):
+        with patch.object(
+            transcribe_mod,
+            "_create_whisper_model",
+            side_effect=RuntimeError("boom"),
+        ):
+            transcribe_mod.preload_resident_models([self._stage_cfg(keep_loaded=True)])
+
+        assert transcribe_mod._MODEL_CACHE == {}
+
+
 class TestRuntimeKeepLoadedToggle:
     """The keep_loaded state can be flipped at runtime (e.g. from the tray menu)."""
 
@@ -0,0 +1,49 @@
+"""Tests for flashing the tray icon from concurrent pipelines."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from voicetype.trayicon import TrayIconController
+
+
+class TestFlashing:
+    def test_concurrent_start_leaves_no_loop_after_stop(self):
+        controller = TrayIconController(MagicMock())
+        flash_threads = []
+
+        class RecordingThread(threading.Thread):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                flash_threads.append(self)
+                # Widen the window between building a loop and installing it
+                time.sleep(0.01)
+
+        for _ in range(20):
+            barrier = threading.Barrier(2)
+
+            def start():
+                barrier.wait()
+                controller.start_flashing("recording")
+
+            workers = [threading.Thread(target=start) for _ in range(2)]
+            with patch("voicetype.trayicon.threading.Thread", RecordingThread):
+                for worker in workers:
+                    worker.start()
+                for worker in workers:
+                    worker.join()
+            controller.stop_flashing()
+
+            assert not [t for t in flash_threads if t.is_alive()]
+
+    def test_restart_stops_previous_loop(self):
+        controller = TrayIconController(MagicMock())
+
+        controller.start_flashing("recording")
+        first = controller._flash_thread
+        controller.start_flashing("processing")
+
+        assert not first.is_alive()
+        assert controller._flash_thread.is_alive()
+        controller.stop_flashing()
+        assert controller._flash_thread is None
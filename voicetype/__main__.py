@@ -1,6 +1,8 @@
 import argparse
 import platform
+import signal
 import sys
+import threading
 from pathlib import Path
 
 from loguru import logger
@@ -13,6 +15,10 @@ from voicetype.pipeline import (
     PipelineManager,
     ResourceManager,
 )
+from voicetype.pipeline.stages.transcribe import (
+    preimport_runtime_modules,
+    preload_resident_models,
+)
 from voicetype.platform_detection import get_compositor_name, get_display_server
 from voicetype.settings import load_settings
 from voicetype.state import AppState, State
@@ -22,10 +28,26 @@ from voicetype.telemetry import (
     shutdown_telemetry,
 )
 from voicetype.trayicon import TrayIconController, _build_menu, create_tray
-from voicetype.utils import get_app_data_dir, play_sound, type_text
+from voicetype.utils import (
+    get_app_data_dir,
+    play_sound,
+    preload_sounds,
+    shutdown_sound_worker,
+    type_text,
+)
 
 HERE = Path(__file__).resolve().parent
 
+# The OS can't change while the process is running, so resolve it once at import.
+# Display-server/compositor lookups are cached in voicetype.platform_detection
+# (see clear_cache() there for refreshing them in tests).
+_SYSTEM = platform.system()
+
+# Log file the file sink was added for, and that sink's id, so re-entering
+# main() in the same process (tests, embedding) doesn't stack duplicate sinks.
+_configured_log_file: Path | None = None
+_log_sink_id: int | None = None
+
 
 def get_log_file_path() -> Path:
     """Get the default path to the log file in the user's config directory."""
@@ -43,6 +65,8 @@ def configure_logging(log_file: Path | None = None) -> Path:
     Returns:
         The path to the log file being used.
     """
+    global _configured_log_file, _log_sink_id
+
     if log_file is None:
         log_file = get_log_file_path()
     else:
@@ -50,9 +74,16 @@ def configure_logging(log_file: Path | None = None) -> Path:
         log_file = Path(log_file).expanduser().resolve()
         log_file.parent.mkdir(parents=True, exist_ok=True)
 
+    if log_file == _configured_log_file:
+        # Every extra sink would write each record again
+        return log_file
+    if _log_sink_id is not None:
+        # Switching files: replace the previous file sink rather than adding one
+        logger.remove(_log_sink_id)
+
     # Keep the default stderr handler for systemd/console output
     # Add a rotating file handler
-    logger.add(
+    _log_sink_id = logger.add(
         log_file,
         rotation="10 MB",  # Rotate when file reaches 10 MB
         retention=3,  # Keep 3 old log files
@@ -63,6 +94,7 @@ def configure_logging(log_file: Path | None = None) -> Path:
         diagnose=True,
     )
 
+    _configured_log_file = log_file
     logger.info(f"Logging to file: {log_file}")
     return log_file
 
@@ -92,10 +124,9 @@ def get_platform_listener(
     Raises:
         RuntimeError: If no suitable hotkey listener can be initialized.
     """
-    system = platform.system()
-    logger.info(f"Detected platform: {system}")
+    logger.info(f"Detected platform: {_SYSTEM}")
 
-    if system == "Linux":
+    if _SYSTEM == "Linux":
         display_server = get_display_server()
         compositor = get_compositor_name()
         logger.info(
@@ -111,20 +142,7 @@ def get_platform_listener(
         )
     except Exception as e:
         logger.error(f"Failed to initialize hotkey listener: {e}", exc_info=True)
-        raise RuntimeError(f"Could not initialize hotkey listener on {system}.") from e
-
-
-def unload_stt_model():
-    """Unload the STT model from GPU memory"""
-    import gc
-
-    import torch
-
-    if torch.cuda.is_available():
-        torch.cuda.empty_cache()
-        torch.cuda.synchronize()
-
-    gc.collect()
+        raise RuntimeError(f"Could not initialize hotkey listener on {_SYSTEM}.") from e
 
 
 def main():
@@ -207,8 +225,34 @@ def main():
             logger.warning("No pipelines configured")
 
         # Rebuild tray menu now that pipeline_manager and pipelines are loaded
+        # (this also seeds the runtime keep_loaded state from config)
         tray.menu = _build_menu(ctx, tray)
 
+        # Decode cue sounds now so the first hotkey press doesn't pay for it
+        preload_sounds(START_RECORD_SOUND, EMPTY_SOUND, ERROR_SOUND)
+
+        # Import the STT libraries the enabled pipelines use and load resident
+        # Whisper models now rather than on the first hotkey press
+        transcribe_configs = [
+            stage_cfg
+            for name in pipeline_manager.list_enabled_pipelines()
+            for stage_cfg in pipeline_manager.pipelines[name].stages
+            if stage_cfg.get("stage") == "Transcribe"
+        ]
+        if transcribe_configs:
+            threading.Thread(
+                target=preimport_runtime_modules,
+                args=(transcribe_configs,),
+                daemon=True,
+                name="preimport",
+            ).start()
+            threading.Thread(
+                target=preload_resident_models,
+                args=(transcribe_configs,),
+                daemon=True,
+                name="model-preload",
+            ).start()
+
         # Initialize hotkey dispatcher
         hotkey_dispatcher = HotkeyDispatcher(pipeline_manager)
 
@@ -225,9 +269,11 @@ def main():
             def on_hotkey_press(hotkey_str: str):
                 """Hotkey press handler - delegates to pipeline manager."""
                 if ctx.state.state == State.ENABLED:
-                    logger.debug(f"Hotkey pressed: {hotkey_str}")
-                    play_sound(START_RECORD_SOUND)
+                    logger.debug("Hotkey pressed: {}", hotkey_str)
+                    # Start the pipeline (and recording) first; the cue sound is
+                    # only queued to the sound worker and must not delay capture.
                     hotkey_dispatcher._on_press(hotkey_str)
+                    play_sound(START_RECORD_SOUND)
                 else:
                     logger.debug(
                         f"Hotkey pressed but app is disabled (state: {ctx.state.state})"
@@ -235,7 +281,7 @@ def main():
 
             def on_hotkey_release(hotkey_str: str):
                 """Hotkey release handler - delegates to pipeline manager."""
-                logger.debug(f"Hotkey released: {hotkey_str}")
+                logger.debug("Hotkey released: {}", hotkey_str)
                 hotkey_dispatcher._on_release(hotkey_str)
 
             # Create platform-specific listener
@@ -246,17 +292,16 @@ def main():
                 log_key_repeat_debug=settings.log_key_repeat_debug,
             )
 
-            # Register hotkeys for ALL enabled pipelines
-            registered_hotkeys = set()
+            # Register hotkeys for ALL enabled pipelines, once per unique hotkey
+            # (the first pipeline using a hotkey names its registration)
+            unique_hotkeys: dict[str, str] = {}
             for pipeline_name in enabled_pipelines:
-                pipeline = pipeline_manager.pipelines[pipeline_name]
-                hotkey_string = pipeline.hotkey
-                if hotkey_string not in registered_hotkeys:
-                    hotkey_listener.add_hotkey(hotkey_string, name=pipeline_name)
-                    registered_hotkeys.add(hotkey_string)
-                    logger.info(
-                        f"Registered hotkey '{hotkey_string}' for pipeline '{pipeline_name}'"
-                    )
+                unique_hotkeys.setdefault(
+                    pipeline_manager.pipelines[pipeline_name].hotkey, pipeline_name
+                )
+            for hotkey_string, pipeline_name in unique_hotkeys.items():
+                hotkey_listener.add_hotkey(hotkey_string, name=pipeline_name)
+            logger.info(f"Registered hotkeys (hotkey -> pipeline): {unique_hotkeys}")
 
             # Set the listener in hotkey dispatcher (for compatibility)
             hotkey_dispatcher.set_hotkey_listener(hotkey_listener)
@@ -267,14 +312,43 @@ def main():
             # Play empty sound to initialize audio system
             play_sound(EMPTY_SOUND)
 
-            # Start listening
-            hotkey_listener.start_listening()
+        def on_tray_ready(icon):
+            """Start listening once the tray is up (runs on pystray's setup thread).
+
+            Starting the listener can block for a long time (the portal listener
+            waits for the user to confirm the shortcut dialog), so it must not
+            hold up the tray event loop on the main thread.
+            """
+            icon.visible = True
+            if hotkey_listener is None:
+                return
+            try:
+                hotkey_listener.start_listening()
+            except Exception as e:
+                logger.error(f"Failed to start hotkey listener: {e}", exc_info=True)
+                icon.stop()
+                return
 
-            logger.info(f"Listening for hotkeys: {registered_hotkeys}")
+            logger.info(f"Listening for hotkeys: {list(unique_hotkeys)}")
             logger.info("Press Ctrl+C to exit.")
 
+        def on_sigterm(signum, frame):
+            """Stop the tray loop so main() falls through to the cleanup below.
+
+            Without this, SIGTERM (e.g. ``systemctl stop``) kills the process
+            outright, skipping listener/pipeline shutdown.
+            """
+            logger.info("Shutdown requested via SIGTERM.")
+            tray.stop()
+
+        try:
+            signal.signal(signal.SIGTERM, on_sigterm)
+        except ValueError:
+            # Only the main thread may install signal handlers
+            logger.debug("Not on the main thread; SIGTERM handler not installed")
+
         # Start the system tray icon (blocks until closed)
-        tray.run()
+        tray.run(setup=on_tray_ready)
 
     except KeyboardInterrupt:
         logger.info("Shutdown requested via KeyboardInterrupt.")
@@ -304,6 +378,8 @@ def main():
                     f"Error shutting down pipeline manager: {e}", exc_info=True
                 )
 
+        shutdown_sound_worker()
+
         # Shutdown telemetry
         try:
             shutdown_telemetry()
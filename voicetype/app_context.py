@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from voicetype.pipeline.pipeline_manager import PipelineManager
 
 
-@dataclass
+@dataclass(slots=True)
 class AppContext:
     """
     The application context, containing all services and state.
@@ -31,9 +31,10 @@ class AppContext:
         Returns:
             bool: True if any pipelines are active, False otherwise
         """
-        if self.pipeline_manager:
-            return len(self.pipeline_manager.executor.active_pipelines) > 0
-        return False
+        pipeline_manager = self.pipeline_manager
+        return pipeline_manager is not None and bool(
+            pipeline_manager.executor.active_pipelines
+        )
 
     @property
     def active_pipeline_count(self) -> int:
@@ -42,6 +43,7 @@ class AppContext:
         Returns:
             int: Number of active pipelines
         """
-        if self.pipeline_manager:
-            return len(self.pipeline_manager.executor.active_pipelines)
-        return 0
+        pipeline_manager = self.pipeline_manager
+        if pipeline_manager is None:
+            return 0
+        return len(pipeline_manager.executor.active_pipelines)
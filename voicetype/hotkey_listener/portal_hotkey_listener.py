@@ -11,9 +11,11 @@ for rebinding. Track progress: https://gitlab.gnome.org/GNOME/xdg-desktop-portal
 """
 
 import asyncio
+import functools
 import secrets
 import subprocess
 import threading
+from types import MappingProxyType
 from typing import Callable, Dict, List, Optional, Tuple
 
 from loguru import logger
@@ -33,6 +35,45 @@ class PortalHotkeyListener(HotkeyListener):
     SHORTCUTS_INTERFACE = "org.freedesktop.portal.GlobalShortcuts"
     REQUEST_INTERFACE = "org.freedesktop.portal.Request"
 
+    # pynput key names -> XKB keysym names used by the portal
+    HOTKEY_KEY_MAP = MappingProxyType(
+        {
+            "<pause>": "Pause",
+            "<ctrl>": "Control",
+            "<alt>": "Alt",
+            "<shift>": "Shift",
+            "<cmd>": "Super",
+            "<super>": "Super",
+            "<tab>": "Tab",
+            "<space>": "space",
+            "<enter>": "Return",
+            "<esc>": "Escape",
+            "<backspace>": "BackSpace",
+            "<delete>": "Delete",
+            "<insert>": "Insert",
+            "<home>": "Home",
+            "<end>": "End",
+            "<page_up>": "Page_Up",
+            "<page_down>": "Page_Down",
+            "<up>": "Up",
+            "<down>": "Down",
+            "<left>": "Left",
+            "<right>": "Right",
+            "<f1>": "F1",
+            "<f2>": "F2",
+            "<f3>": "F3",
+            "<f4>": "F4",
+            "<f5>": "F5",
+            "<f6>": "F6",
+            "<f7>": "F7",
+            "<f8>": "F8",
+            "<f9>": "F9",
+            "<f10>": "F10",
+            "<f11>": "F11",
+            "<f12>": "F12",
+        }
+    )
+
     def __init__(
         self,
         on_hotkey_press: Optional[Callable[[str], None]] = None,
@@ -86,41 +127,7 @@ class PortalHotkeyListener(HotkeyListener):
 
     def _convert_hotkey_format(self, hotkey: str) -> str:
         """Convert pynput hotkey format to XDG portal format."""
-        key_map = {
-            "<pause>": "Pause",
-            "<ctrl>": "Control",
-            "<alt>": "Alt",
-            "<shift>": "Shift",
-            "<cmd>": "Super",
-            "<super>": "Super",
-            "<tab>": "Tab",
-            "<space>": "space",
-            "<enter>": "Return",
-            "<esc>": "Escape",
-            "<backspace>": "BackSpace",
-            "<delete>": "Delete",
-            "<insert>": "Insert",
-            "<home>": "Home",
-            "<end>": "End",
-            "<page_up>": "Page_Up",
-            "<page_down>": "Page_Down",
-            "<up>": "Up",
-            "<down>": "Down",
-            "<left>": "Left",
-            "<right>": "Right",
-            "<f1>": "F1",
-            "<f2>": "F2",
-            "<f3>": "F3",
-            "<f4>": "F4",
-            "<f5>": "F5",
-            "<f6>": "F6",
-            "<f7>": "F7",
-            "<f8>": "F8",
-            "<f9>": "F9",
-            "<f10>": "F10",
-            "<f11>": "F11",
-            "<f12>": "F12",
-        }
+        key_map = self.HOTKEY_KEY_MAP
 
         if "<" not in hotkey:
             return hotkey
@@ -797,8 +804,14 @@ class PortalHotkeyListener(HotkeyListener):
         return True
 
 
+@functools.lru_cache(maxsize=1)
 def is_portal_available() -> bool:
-    """Check if the GlobalShortcuts portal is available."""
+    """Check if the GlobalShortcuts portal is available.
+
+    The result is cached since it shells out to dbus-send/busctl (up to two
+    subprocesses) and can't change during a session. Call
+    ``is_portal_available.cache_clear()`` to re-probe.
+    """
     try:
         result = subprocess.run(
             [
@@ -1,5 +1,5 @@
 import threading
-from typing import Callable, Dict, Optional, Set
+from typing import Callable, Dict, FrozenSet, Optional, Set
 
 from loguru import logger
 
@@ -16,6 +16,10 @@ class PynputHotkeyListener(HotkeyListener):
     This class handles keyboard events to detect when specific hotkey
     combinations are pressed and released. Supports multiple hotkeys
     simultaneously. Works on Windows, Linux (X11), and macOS.
+
+    The key handlers are only called from pynput's listener thread, one event
+    at a time, and stop_listening() joins that thread before resetting the key
+    state, so the handlers own that state and take no lock per key event.
     """
 
     def __init__(
@@ -25,16 +29,15 @@ class PynputHotkeyListener(HotkeyListener):
     ):
         super().__init__(on_hotkey_press, on_hotkey_release)
         # hotkey_string -> parsed key set
-        self._hotkey_combos: Dict[str, Set[keyboard.Key | keyboard.KeyCode]] = {}
+        self._hotkey_combos: Dict[str, FrozenSet[keyboard.Key | keyboard.KeyCode]] = {}
         self._listener: Optional[keyboard.Listener] = None
         self._pressed_keys: Set[keyboard.Key | keyboard.KeyCode] = set()
         # Track press state per hotkey string
         self._hotkey_pressed: Dict[str, bool] = {}
-        self._lock = threading.Lock()
 
     def add_hotkey(self, hotkey: str, name: str = "") -> None:
         try:
-            combo = set(keyboard.HotKey.parse(hotkey))
+            combo = frozenset(keyboard.HotKey.parse(hotkey))
             self._hotkey_combos[hotkey] = combo
             self._hotkey_pressed[hotkey] = False
             logger.info(f"Hotkey added: {hotkey} -> {combo}")
@@ -50,36 +53,39 @@ class PynputHotkeyListener(HotkeyListener):
         if key is None or not self._hotkey_combos:
             return
 
-        with self._lock:
-            canonical_key = self._listener.canonical(key)
-            self._pressed_keys.add(canonical_key)
+        canonical_key = self._listener.canonical(key)
+        pressed_keys = self._pressed_keys
+        # Auto-repeat of a held key leaves the pressed set unchanged, so no
+        # hotkey can newly match; skip the scan for the repeat stream
+        if canonical_key in pressed_keys:
+            return
+        pressed_keys.add(canonical_key)
 
-            for hotkey_str, combo in self._hotkey_combos.items():
-                if not self._hotkey_pressed[hotkey_str] and combo.issubset(
-                    self._pressed_keys
-                ):
-                    logger.debug(f"Hotkey detected: {hotkey_str}")
-                    self._hotkey_pressed[hotkey_str] = True
-                    self._trigger_hotkey_press(hotkey_str)
+        hotkey_pressed = self._hotkey_pressed
+        for hotkey_str, combo in self._hotkey_combos.items():
+            if not hotkey_pressed[hotkey_str] and combo.issubset(pressed_keys):
+                logger.debug("Hotkey detected: {}", hotkey_str)
+                hotkey_pressed[hotkey_str] = True
+                self._trigger_hotkey_press(hotkey_str)
 
     def _on_key_release(self, key: Optional[keyboard.Key | keyboard.KeyCode]):
         if key is None or not self._hotkey_combos:
             return
 
         canonical_key = self._listener.canonical(key)
-
-        with self._lock:
-            for hotkey_str, combo in self._hotkey_combos.items():
-                if self._hotkey_pressed[hotkey_str] and canonical_key in combo:
-                    any_hotkey_key_pressed = any(
-                        k in self._pressed_keys for k in combo if k != canonical_key
-                    )
-                    if not any_hotkey_key_pressed:
-                        self._hotkey_pressed[hotkey_str] = False
-                        self._trigger_hotkey_release(hotkey_str)
-
-            if canonical_key in self._pressed_keys:
-                self._pressed_keys.remove(canonical_key)
+        pressed_keys = self._pressed_keys
+        pressed_keys.discard(canonical_key)
+
+        hotkey_pressed = self._hotkey_pressed
+        for hotkey_str, combo in self._hotkey_combos.items():
+            # Released once none of its keys are still held
+            if (
+                hotkey_pressed[hotkey_str]
+                and canonical_key in combo
+                and combo.isdisjoint(pressed_keys)
+            ):
+                hotkey_pressed[hotkey_str] = False
+                self._trigger_hotkey_release(hotkey_str)
 
     def start_listening(self) -> None:
         if self._listener is not None and self._listener.is_alive():
@@ -5,10 +5,13 @@ in a pipeline execution.
 """
 
 import threading
-from typing import Any, Dict, Optional, Protocol
+from typing import TYPE_CHECKING, Any, Dict, Optional, Protocol
 
 from .trigger_events import TriggerEvent
 
+if TYPE_CHECKING:
+    from .stages.record_audio import RecordedAudio
+
 
 class IconController(Protocol):
     """Interface for controlling the system tray icon state.
@@ -48,6 +51,7 @@ class PipelineContext:
     - Icon controller for updating system tray
     - Optional trigger event (for hotkey/timer triggers)
     - Cancellation event
+    - The in-memory samples of the latest recording, set by RecordAudio
     """
 
     def __init__(
@@ -69,3 +73,6 @@ class PipelineContext:
         self.icon_controller = icon_controller
         self.trigger_event = trigger_event
         self.cancel_requested = cancel_requested or threading.Event()
+        # Set by RecordAudio so later stages can use the samples without
+        # decoding the file at its returned path
+        self.recorded_audio: Optional["RecordedAudio"] = None
@@ -6,6 +6,7 @@ The HotkeyDispatcher bridges hotkey events to pipeline execution, managing:
 - TriggerEvent creation and lifecycle
 """
 
+import threading
 from typing import Callable, Dict, Optional
 
 from loguru import logger
@@ -34,6 +35,8 @@ class HotkeyDispatcher:
         self.active_events: Dict[str, HotkeyTriggerEvent] = (
             {}
         )  # hotkey -> trigger event
+        # Press/release callbacks arrive on listener threads; guard active_events
+        self._events_lock = threading.Lock()
         self.hotkey_listener = None  # Will be set by application
 
     def register_hotkey(
@@ -60,7 +63,7 @@ class HotkeyDispatcher:
 
         # Register with the platform-specific listener
         # Note: The actual registration API depends on the listener implementation
-        logger.info(f"Registering hotkey: {hotkey}")
+        logger.info("Registering hotkey: {}", hotkey)
 
     def set_hotkey_listener(self, listener):
         """Set the platform-specific hotkey listener.
@@ -79,14 +82,23 @@ class HotkeyDispatcher:
         # Get pipeline for this hotkey
         pipeline = self.pipeline_manager.get_pipeline_by_hotkey(hotkey)
         if not pipeline:
-            logger.warning(f"No pipeline found for hotkey: {hotkey}")
+            logger.warning("No pipeline found for hotkey: {}", hotkey)
             return
 
-        # Create trigger event
-        trigger_event = HotkeyTriggerEvent()
-        self.active_events[hotkey] = trigger_event
+        # Create trigger event. A second press while one is still active (e.g.
+        # key auto-repeat) must not replace it, or the running pipeline would
+        # never see its release. The entry lives only as long as its pipeline,
+        # so a lost release can't leave the hotkey stuck.
+        trigger_event = HotkeyTriggerEvent(
+            on_finished=lambda: self._discard_event(hotkey, trigger_event)
+        )
+        with self._events_lock:
+            if hotkey in self.active_events:
+                logger.debug("Hotkey already active, ignoring press: {}", hotkey)
+                return
+            self.active_events[hotkey] = trigger_event
 
-        logger.debug(f"Hotkey pressed: {hotkey} -> pipeline '{pipeline.name}'")
+        logger.debug("Hotkey pressed: {} -> pipeline '{}'", hotkey, pipeline.name)
 
         # Execute pipeline on thread pool (non-blocking)
         pipeline_id = self.pipeline_manager.trigger_pipeline(
@@ -95,25 +107,37 @@ class HotkeyDispatcher:
 
         if pipeline_id is None:
             # Resources unavailable, cleanup trigger event
-            del self.active_events[hotkey]
+            self._discard_event(hotkey, trigger_event)
             logger.warning(
-                f"Pipeline '{pipeline.name}' could not start (resources busy)"
+                "Pipeline '{}' could not start (resources busy)", pipeline.name
             )
 
+    def _discard_event(self, hotkey: str, trigger_event: HotkeyTriggerEvent):
+        """Stop tracking ``trigger_event`` if it is still the hotkey's active one.
+
+        Args:
+            hotkey: Hotkey string the event was created for
+            trigger_event: Event to remove
+        """
+        with self._events_lock:
+            if self.active_events.get(hotkey) is trigger_event:
+                del self.active_events[hotkey]
+
     def _on_release(self, hotkey: str):
         """Handle hotkey release - signal trigger event.
 
         Args:
             hotkey: Hotkey string that was released
         """
-        if hotkey in self.active_events:
-            trigger_event = self.active_events[hotkey]
+        with self._events_lock:
+            trigger_event = self.active_events.pop(hotkey, None)
+        if trigger_event is not None:
             trigger_event.signal_release()
-            del self.active_events[hotkey]
-            logger.debug(f"Hotkey released: {hotkey}")
+            logger.debug("Hotkey released: {}", hotkey)
         else:
             logger.debug(
-                f"Hotkey released but no active event: {hotkey} (may have been cancelled)"
+                "Hotkey released but no active event: {} (may have been cancelled)",
+                hotkey,
             )
 
     def register_all_pipelines(self):
@@ -130,7 +154,7 @@ class HotkeyDispatcher:
             p for p in self.pipeline_manager.pipelines.values() if p.enabled
         ]
 
-        logger.info(f"Registering hotkeys for {len(enabled_pipelines)} pipeline(s)")
+        logger.info("Registering hotkeys for {} pipeline(s)", len(enabled_pipelines))
 
         for pipeline in enabled_pipelines:
             self.register_hotkey(pipeline.hotkey)
@@ -60,6 +60,9 @@ class PipelineExecutor:
         self.cancel_events: Dict[str, threading.Event] = (
             {}
         )  # pipeline_id -> cancel_event
+        self.trigger_events: Dict[str, TriggerEvent] = (
+            {}
+        )  # pipeline_id -> trigger_event, interrupted on cancel
         self._shutdown = False
 
     def execute_pipeline(
@@ -98,13 +101,17 @@ class PipelineExecutor:
             # Resources unavailable
             blocked = self.resource_manager.get_blocked_by(required_resources)
             logger.warning(
-                f"Cannot start pipeline '{pipeline_name}': resources {[r.value for r in blocked]} in use"
+                "Cannot start pipeline '{}': resources {} in use",
+                pipeline_name,
+                [r.value for r in blocked],
             )
             return None
 
         # Create cancel event for this pipeline
         cancel_event = threading.Event()
         self.cancel_events[pipeline_id] = cancel_event
+        if trigger_event is not None:
+            self.trigger_events[pipeline_id] = trigger_event
 
         # Submit to thread pool (returns immediately)
         future = self.executor.submit(
@@ -122,7 +129,7 @@ class PipelineExecutor:
         # Add callback for cleanup
         future.add_done_callback(lambda f: self._on_pipeline_complete(pipeline_id, f))
 
-        logger.info(f"Started pipeline '{pipeline_name}' (id={pipeline_id})")
+        logger.info("Started pipeline '{}' (id={})", pipeline_name, pipeline_id)
         return pipeline_id
 
     def _execute_pipeline(
@@ -204,13 +211,13 @@ class PipelineExecutor:
                 ) in enumerate(stage_configs_parsed):
                     # Check for cancellation
                     if context.cancel_requested.is_set():
-                        logger.info(f"Pipeline '{pipeline_name}' cancelled")
+                        logger.info("Pipeline '{}' cancelled", pipeline_name)
                         trace.get_current_span().set_status(
                             Status(StatusCode.ERROR, "Cancelled")
                         )
                         return
 
-                    logger.debug(f"[{pipeline_name}] Starting stage: {stage_name}")
+                    logger.debug("[{}] Starting stage: {}", pipeline_name, stage_name)
 
                     # Create stage span with configuration as attributes
                     if tracer is not None:
@@ -253,7 +260,10 @@ class PipelineExecutor:
                                 current_span.set_status(Status(StatusCode.OK))
 
                             logger.debug(
-                                f"[{pipeline_name}] Stage {stage_name} completed in {stage_duration:.2f}s"
+                                "[{}] Stage {} completed in {:.2f}s",
+                                pipeline_name,
+                                stage_name,
+                                stage_duration,
                             )
 
                         except Exception as e:
@@ -279,15 +289,14 @@ class PipelineExecutor:
                     current_span.set_status(Status(StatusCode.OK))
 
                 logger.info(
-                    f"Pipeline '{pipeline_name}' completed successfully in {pipeline_duration:.2f}s"
+                    "Pipeline '{}' completed successfully in {:.2f}s",
+                    pipeline_name,
+                    pipeline_duration,
                 )
 
         except Exception as e:
             pipeline_duration = time.time() - pipeline_start_time
-            logger.error(
-                f"Pipeline '{pipeline_name}' failed: {e}",
-                exc_info=True,
-            )
+            logger.error("Pipeline '{}' failed: {}", pipeline_name, e, exc_info=True)
             current_span = trace.get_current_span()
             if current_span.is_recording():
                 current_span.set_attribute(
@@ -308,7 +317,7 @@ class PipelineExecutor:
                     try:
                         stage_instance.cleanup()
                     except Exception as e:
-                        logger.warning(f"Stage cleanup failed: {e}", exc_info=True)
+                        logger.warning("Stage cleanup failed: {}", e, exc_info=True)
 
             # Release acquired resources
             self.resource_manager.release(pipeline_id)
@@ -337,11 +346,29 @@ class PipelineExecutor:
         try:
             future.result()  # Re-raises any exceptions
         except Exception as e:
-            logger.error(f"Pipeline {pipeline_id} failed with exception: {e}")
+            logger.error("Pipeline {} failed with exception: {}", pipeline_id, e)
         finally:
             # Remove from active pipelines and cancel events
             self.active_pipelines.pop(pipeline_id, None)
             self.cancel_events.pop(pipeline_id, None)
+            trigger_event = self.trigger_events.pop(pipeline_id, None)
+            if trigger_event is not None:
+                try:
+                    trigger_event.pipeline_finished()
+                except Exception as e:
+                    logger.error(
+                        "Trigger cleanup for pipeline {} failed: {}", pipeline_id, e
+                    )
+
+    def _interrupt_trigger(self, pipeline_id: str):
+        """Wake a stage blocked on the pipeline's trigger (e.g. still recording).
+
+        Must be called after the cancel event is set, so the woken stage sees
+        the cancellation instead of treating it as a normal completion.
+        """
+        trigger_event = self.trigger_events.get(pipeline_id)
+        if trigger_event is not None:
+            trigger_event.interrupt()
 
     def cancel_pipeline(self, pipeline_id: str):
         """Cancel a specific running pipeline.
@@ -349,15 +376,18 @@ class PipelineExecutor:
         Args:
             pipeline_id: Pipeline identifier to cancel
         """
-        if pipeline_id in self.cancel_events:
+        # Single get() lookups: the completion callback may pop these entries
+        # from a worker thread at any time.
+        cancel_event = self.cancel_events.get(pipeline_id)
+        if cancel_event is not None:
             # Signal cancellation to the running pipeline
-            self.cancel_events[pipeline_id].set()
-            logger.info(f"Requested cancellation of pipeline {pipeline_id}")
+            cancel_event.set()
+            logger.info("Requested cancellation of pipeline {}", pipeline_id)
+            self._interrupt_trigger(pipeline_id)
 
-        if pipeline_id in self.active_pipelines:
-            future = self.active_pipelines[pipeline_id]
-            if not future.done():
-                future.cancel()
+        future = self.active_pipelines.get(pipeline_id)
+        if future is not None and not future.done():
+            future.cancel()
 
     def cancel_all_pipelines(self):
         """Request cancellation of all active pipelines.
@@ -371,11 +401,12 @@ class PipelineExecutor:
             return
 
         logger.info(
-            f"Requesting cancellation of {len(self.cancel_events)} active pipeline(s)"
+            "Requesting cancellation of {} active pipeline(s)", len(self.cancel_events)
         )
         for pipeline_id, cancel_event in list(self.cancel_events.items()):
             cancel_event.set()
-            logger.debug(f"Signaled cancellation for pipeline {pipeline_id}")
+            logger.debug("Signaled cancellation for pipeline {}", pipeline_id)
+            self._interrupt_trigger(pipeline_id)
 
     def shutdown(self, timeout: float = 5.0):
         """Gracefully shutdown pipeline executor with timeout.
@@ -389,8 +420,8 @@ class PipelineExecutor:
         # Signal all pipelines to cancel gracefully
         self.cancel_all_pipelines()
 
-        # Also cancel all pending futures
-        for future in self.active_pipelines.values():
+        # Also cancel all pending futures (snapshot: completions mutate the dict)
+        for future in list(self.active_pipelines.values()):
             if not future.done():
                 future.cancel()
 
@@ -406,7 +437,7 @@ class PipelineExecutor:
             try:
                 future.result(timeout=remaining)
             except Exception as e:
-                logger.error(f"Pipeline {pipeline_id} failed during shutdown: {e}")
+                logger.error("Pipeline {} failed during shutdown: {}", pipeline_id, e)
 
         # Final executor shutdown (non-blocking)
         self.executor.shutdown(wait=False, cancel_futures=True)
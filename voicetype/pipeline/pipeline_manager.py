@@ -94,7 +94,7 @@ class PipelineManager:
             ValueError: If hotkey conflicts or invalid configurations detected
             TypeError: If pipeline stages have type mismatches
         """
-        logger.info(f"Loading {len(pipelines_config)} pipeline(s)...")
+        logger.info("Loading {} pipeline(s)...", len(pipelines_config))
 
         stage_definitions = stage_definitions or {}
 
@@ -131,8 +131,11 @@ class PipelineManager:
                 self.hotkey_to_pipeline[hotkey] = name
 
             logger.info(
-                f"Loaded pipeline '{name}': {' -> '.join(stage_names)} "
-                f"(hotkey={hotkey}, enabled={enabled})"
+                "Loaded pipeline '{}': {} (hotkey={}, enabled={})",
+                name,
+                " -> ".join(stage_names),
+                hotkey,
+                enabled,
             )
 
         logger.info("All pipelines loaded and validated successfully")
@@ -238,11 +241,11 @@ class PipelineManager:
         """
         pipeline = self.get_pipeline_by_name(pipeline_name)
         if not pipeline:
-            logger.error(f"Pipeline '{pipeline_name}' not found")
+            logger.error("Pipeline '{}' not found", pipeline_name)
             return None
 
         if not pipeline.enabled:
-            logger.warning(f"Pipeline '{pipeline_name}' is disabled")
+            logger.warning("Pipeline '{}' is disabled", pipeline_name)
             return None
 
         return self.executor.execute_pipeline(
@@ -110,22 +110,26 @@ class ResourceManager:
                     for prev_resource in acquired:
                         self._locks[prev_resource].release()
                     logger.debug(
-                        f"Pipeline {pipeline_id} failed to acquire {resource.value}"
+                        "Pipeline {} failed to acquire {}", pipeline_id, resource.value
                     )
                     return False
                 acquired.append(resource)
-                logger.debug(f"Pipeline {pipeline_id} acquired {resource.value}")
+                logger.debug("Pipeline {} acquired {}", pipeline_id, resource.value)
 
             # Successfully acquired all resources
             self._pipeline_resources[pipeline_id] = resources
             logger.debug(
-                f"Pipeline {pipeline_id} successfully acquired all resources: {[r.value for r in resources]}"
+                "Pipeline {} successfully acquired all resources: {}",
+                pipeline_id,
+                [r.value for r in resources],
             )
             return True
 
         except Exception as e:
             # On any error, release all acquired locks
-            logger.error(f"Error acquiring resources for pipeline {pipeline_id}: {e}")
+            logger.error(
+                "Error acquiring resources for pipeline {}: {}", pipeline_id, e
+            )
             for resource in acquired:
                 self._locks[resource].release()
             raise
@@ -137,13 +141,13 @@ class ResourceManager:
             pipeline_id: Unique identifier for the pipeline execution
         """
         if pipeline_id not in self._pipeline_resources:
-            logger.debug(f"Pipeline {pipeline_id} has no resources to release")
+            logger.debug("Pipeline {} has no resources to release", pipeline_id)
             return
 
         resources = self._pipeline_resources.pop(pipeline_id)
         for resource in resources:
             self._locks[resource].release()
-            logger.debug(f"Pipeline {pipeline_id} released {resource.value}")
+            logger.debug("Pipeline {} released {}", pipeline_id, resource.value)
 
     def get_blocked_by(self, resources: Set[Resource]) -> Set[Resource]:
         """Return which of the requested resources are currently locked.
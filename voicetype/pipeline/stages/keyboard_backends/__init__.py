@@ -101,7 +101,7 @@ def _create_auto_backend(
     """
     # Not Linux - use pynput
     if sys.platform != "linux":
-        logger.info(f"Using pynput keyboard backend (platform: {sys.platform})")
+        logger.info("Using pynput keyboard backend (platform: {})", sys.platform)
         return PynputKeyboard(char_delay=char_delay)
 
     # Import platform detection (only available on Linux)
@@ -128,12 +128,13 @@ def _create_auto_backend(
 
     # Wayland - determine which backend to use
     compositor = get_compositor_type()
-    logger.debug(f"Detected Wayland compositor type: {compositor.value}")
+    logger.debug("Detected Wayland compositor type: {}", compositor.value)
 
     # GNOME or KDE with EI support -> try eitype
     if compositor in (CompositorType.GNOME, CompositorType.KDE) and supports_is():
         logger.info(
-            f"Using eitype keyboard backend (Wayland {compositor.value} with EI support)"
+            "Using eitype keyboard backend (Wayland {} with EI support)",
+            compositor.value,
         )
         return EitypeKeyboard()
 
@@ -145,12 +146,13 @@ def _create_auto_backend(
     # Unknown Wayland compositor - try eitype first (if portal available), then wtype
     if supports_is():
         logger.info(
-            f"Using eitype keyboard backend (Wayland {compositor.value} with RemoteDesktop portal)"
+            "Using eitype keyboard backend (Wayland {} with RemoteDesktop portal)",
+            compositor.value,
         )
         return EitypeKeyboard()
 
     # Last resort for Wayland - try wtype
     logger.info(
-        f"Using wtype keyboard backend (Wayland {compositor.value}, no EI support)"
+        "Using wtype keyboard backend (Wayland {}, no EI support)", compositor.value
     )
     return WtypeKeyboard()
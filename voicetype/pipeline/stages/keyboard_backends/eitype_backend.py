@@ -41,7 +41,7 @@ def clear_cached_connection() -> None:
             _cached_typer.close()
         except Exception as e:
             logger.debug(
-                f"EitypeKeyboard: error closing stale connection (ignored): {e}"
+                "EitypeKeyboard: error closing stale connection (ignored): {}", e
             )
         _cached_typer = None
 
@@ -58,10 +58,10 @@ def _load_token() -> str | None:
         try:
             token = token_path.read_text().strip()
             if token:
-                logger.debug(f"EitypeKeyboard: loaded token from {token_path}")
+                logger.debug("EitypeKeyboard: loaded token from {}", token_path)
                 return token
         except Exception as e:
-            logger.warning(f"EitypeKeyboard: failed to load token: {e}")
+            logger.warning("EitypeKeyboard: failed to load token: {}", e)
     return None
 
 
@@ -71,9 +71,9 @@ def _save_token(token: str) -> None:
     try:
         token_path.parent.mkdir(parents=True, exist_ok=True)
         token_path.write_text(token)
-        logger.debug(f"EitypeKeyboard: saved token to {token_path}")
+        logger.debug("EitypeKeyboard: saved token to {}", token_path)
     except Exception as e:
-        logger.warning(f"EitypeKeyboard: failed to save token: {e}")
+        logger.warning("EitypeKeyboard: failed to save token: {}", e)
 
 
 class EitypeKeyboard:
@@ -138,7 +138,7 @@ class EitypeKeyboard:
         Raises:
             RuntimeError: If eitype fails to type after retry
         """
-        logger.debug(f"EitypeKeyboard: typing {len(text)} characters")
+        logger.debug("EitypeKeyboard: typing {} characters", len(text))
 
         try:
             typer = self._get_typer()
@@ -148,7 +148,7 @@ class EitypeKeyboard:
         except Exception as e:
             # Connection may be stale - close it properly and retry once
             logger.warning(
-                f"EitypeKeyboard: typing failed, retrying with fresh connection: {e}"
+                "EitypeKeyboard: typing failed, retrying with fresh connection: {}", e
             )
             clear_cached_connection()
 
@@ -38,16 +38,22 @@ class PynputKeyboard:
     def type_text(self, text: str) -> None:
         """Type the given text character-by-character.
 
+        With ``char_delay`` set to 0 the whole text is typed in a single call.
+
         Args:
             text: The text to type
         """
-        logger.debug(f"PynputKeyboard: typing {len(text)} characters")
+        logger.debug("PynputKeyboard: typing {} characters", len(text))
         keyboard = self._get_controller()
 
-        for i, char in enumerate(text):
-            keyboard.type(char)
-            # Don't sleep after the last character
-            if self.char_delay > 0 and i < len(text) - 1:
+        if self.char_delay <= 0 or len(text) <= 1:
+            # No pacing needed: hand the whole string over in one call
+            keyboard.type(text)
+        else:
+            # Sleep between characters, not after the last one
+            keyboard.type(text[0])
+            for char in text[1:]:
                 time.sleep(self.char_delay)
+                keyboard.type(char)
 
         logger.debug("PynputKeyboard: typing complete")
@@ -40,7 +40,7 @@ class WtypeKeyboard:
                 "  - Fedora: sudo dnf install wtype\n"
                 "  - Or build from source: https://github.com/atx/wtype"
             )
-        logger.debug(f"WtypeKeyboard: using wtype at {self._wtype_path}")
+        logger.debug("WtypeKeyboard: using wtype at {}", self._wtype_path)
 
     def type_text(self, text: str) -> None:
         """Type the given text using wtype.
@@ -51,7 +51,7 @@ class WtypeKeyboard:
         Raises:
             RuntimeError: If wtype command fails
         """
-        logger.debug(f"WtypeKeyboard: typing {len(text)} characters")
+        logger.debug("WtypeKeyboard: typing {} characters", len(text))
 
         try:
             # Use "--" to prevent text starting with "-" being interpreted as flags
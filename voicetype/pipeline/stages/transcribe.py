@@ -4,12 +4,15 @@ This stage transcribes audio files to text using the configured STT provider
 (local Whisper or LiteLLM API).
 """
 
+import importlib
 import os
+import shutil
+import subprocess
 import sys
 import tempfile
 import threading
 from pathlib import Path
-from typing import Annotated, Literal, Optional, Union
+from typing import TYPE_CHECKING, Annotated, Literal, Optional, Union
 
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -20,6 +23,9 @@ from voicetype.pipeline.context import PipelineContext
 from voicetype.pipeline.stage_registry import STAGE_REGISTRY, PipelineStage
 from voicetype.utils import get_app_data_dir
 
+if TYPE_CHECKING:
+    from voicetype.pipeline.stages.record_audio import RecordedAudio
+
 
 def get_bundled_model_path(model_name: str) -> Optional[Path]:
     """Get path to bundled Whisper model if it exists.
@@ -39,23 +45,119 @@ def get_bundled_model_path(model_name: str) -> Optional[Path]:
             Path(sys._MEIPASS) / "voicetype" / "models" / f"faster-whisper-{model_name}"
         )
         if bundled_path.exists():
-            logger.debug(f"Found bundled model at {bundled_path}")
+            logger.debug("Found bundled model at {}", bundled_path)
             return bundled_path
 
     # Also check relative to the voicetype package (for development)
     package_dir = Path(__file__).parent.parent.parent
     dev_path = package_dir / "models" / f"faster-whisper-{model_name}"
     if dev_path.exists():
-        logger.debug(f"Found model at {dev_path}")
+        logger.debug("Found model at {}", dev_path)
         return dev_path
 
     return None
 
 
+# Sample rate Whisper models expect; faster-whisper doesn't resample arrays
+WHISPER_SAMPLE_RATE = 16000
+
+# Bit rate for MP3 uploads; plenty for speech at 16 kHz mono
+MP3_BIT_RATE = 64000
+
+# Recordings larger than this are converted before upload (OpenAI caps at 25 MB)
+MAX_UPLOAD_BYTES = int(24.9 * 1024 * 1024)
+
+
 class TranscriptionError(Exception):
     """Exception raised for transcription errors."""
 
 
+def _resample_for_whisper(samples, sample_rate: int):
+    """Resample mono float32 samples to WHISPER_SAMPLE_RATE in memory.
+
+    faster-whisper only accepts arrays that are already at 16 kHz. This uses
+    the same libswresample resampler (through PyAV, a faster-whisper
+    dependency) that faster-whisper applies when decoding a file, minus the
+    file read and decode.
+    """
+    import av
+    import numpy as np
+
+    frame = av.AudioFrame.from_ndarray(
+        samples.reshape(1, -1), format="flt", layout="mono"
+    )
+    frame.sample_rate = sample_rate
+    resampler = av.AudioResampler(format="flt", layout="mono", rate=WHISPER_SAMPLE_RATE)
+    # resample(None) flushes the samples the resampler holds back
+    frames = resampler.resample(frame) + resampler.resample(None)
+    if not frames:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate([f.to_ndarray() for f in frames], axis=1).reshape(-1)
+
+
+def _encode_mp3(samples, sample_rate: int, dst: str) -> None:
+    """Encode mono float32 samples to a 64 kbps MP3 at ``dst`` with libmp3lame.
+
+    Runs in-process through PyAV, so there is no subprocess and the WAV on disk
+    is never read back. PyAV buffers and converts the samples into the frame
+    size and sample format the encoder wants.
+    """
+    import av
+
+    frame = av.AudioFrame.from_ndarray(
+        samples.reshape(1, -1), format="flt", layout="mono"
+    )
+    frame.sample_rate = sample_rate
+    with av.open(dst, "w", format="mp3") as container:
+        stream = container.add_stream("mp3", rate=sample_rate, layout="mono")
+        stream.bit_rate = MP3_BIT_RATE
+        # encode(None) flushes the samples the encoder holds back
+        for packet in stream.encode(frame) + stream.encode(None):
+            container.mux(packet)
+
+
+def _convert_audio_file(
+    src: str,
+    dst: str,
+    audio_format: str,
+    recording: Optional["RecordedAudio"] = None,
+) -> None:
+    """Convert an audio file to ``audio_format`` for upload.
+
+    MP3 is encoded in-process from the in-memory ``recording`` of ``src`` when
+    one is given and PyAV is installed (it comes with faster-whisper). Otherwise
+    runs ffmpeg directly when it is on PATH, so the samples stream from file to
+    file without being decoded into Python memory, and falls back to pydub (which
+    loads the whole recording as an AudioSegment first) as a last resort.
+
+    Args:
+        src: Path of the WAV file to convert
+        dst: Path to write the converted file to
+        audio_format: Target format (e.g. "mp3")
+        recording: In-memory samples of ``src``, if available
+
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg fails
+        CouldntDecodeError, CouldntEncodeError: If the pydub fallback fails
+    """
+    if audio_format == "mp3" and recording is not None:
+        try:
+            _encode_mp3(recording.samples, recording.sample_rate, dst)
+            return
+        except ImportError:
+            logger.debug("PyAV not installed, converting {} with ffmpeg", src)
+
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        AudioSegment.from_wav(src).export(dst, format=audio_format)
+        return
+    subprocess.run(
+        [ffmpeg, "-y", "-loglevel", "error", "-i", src, "-b:a", str(MP3_BIT_RATE), dst],
+        check=True,
+        capture_output=True,
+    )
+
+
 def _cuda_synchronize():
     """Call cudaDeviceSynchronize to release leaked CUDA memory.
 
@@ -86,6 +188,16 @@ _MODEL_CACHE: dict[tuple[str, str, str], object] = {}
 _MODEL_CACHE_LOCK = threading.Lock()
 
 
+def _default_compute_type(device: str) -> str:
+    """Return the CTranslate2 compute type to load a model with on ``device``.
+
+    Weights are quantized to int8 on both devices, which roughly halves memory
+    bandwidth and resident size versus float16 with negligible accuracy loss.
+    On CUDA, activations stay in float16 (``int8_float16``).
+    """
+    return "int8_float16" if device == "cuda" else "int8"
+
+
 def _create_whisper_model(
     model_path: str, device: str, compute_type: str, models_dir: str
 ):
@@ -117,12 +229,35 @@ def _create_whisper_model(
     except LocalEntryNotFoundError:
         # Not cached locally (e.g. first run) -- allow the network download.
         logger.info(
-            f"Model '{model_path}' not in local cache; "
-            f"downloading from the HuggingFace Hub..."
+            "Model '{}' not in local cache; downloading from the HuggingFace Hub...",
+            model_path,
         )
         return WhisperModel(model_path, local_files_only=False, **kwargs)
 
 
+def _warm_up_whisper_model(model, device: str) -> None:
+    """Run one throwaway inference so the first real transcription is fast.
+
+    CTranslate2 defers kernel selection and allocator growth until the first
+    non-trivial input, so without this the first hotkey release after loading
+    still pays a multi-second penalty. One second of low-level noise is enough
+    to trigger it. Failures are logged and ignored; the model is still usable.
+    """
+    try:
+        import numpy as np
+
+        audio = np.random.randn(16000).astype(np.float32) * 0.01
+        segments, _ = model.transcribe(audio, beam_size=1, vad_filter=False)
+        # transcribe() is lazy; decoding only happens when segments are consumed.
+        for _ in segments:
+            pass
+        if device == "cuda":
+            _cuda_synchronize()
+        logger.debug("Whisper model warm-up complete")
+    except Exception as e:
+        logger.debug("Whisper model warm-up skipped: {}", e)
+
+
 def _get_or_create_whisper_model(
     model_path: str,
     device: str,
@@ -135,7 +270,7 @@ def _get_or_create_whisper_model(
     When ``keep_loaded`` is False the model is constructed fresh on every call
     (the historical behavior). When True, the model is loaded once per
     (model_path, device, compute_type) and reused for the lifetime of the
-    process.
+    process. Resident models are warmed up once after loading.
     """
     if not keep_loaded:
         return _create_whisper_model(model_path, device, compute_type, models_dir)
@@ -145,6 +280,7 @@ def _get_or_create_whisper_model(
         model = _MODEL_CACHE.get(key)
         if model is None:
             model = _create_whisper_model(model_path, device, compute_type, models_dir)
+            _warm_up_whisper_model(model, device)
             _MODEL_CACHE[key] = model
         return model
 
@@ -229,6 +365,24 @@ class LocalSTTRuntime(BaseModel):
             "lifetime of the process."
         ),
     )
+    beam_size: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Beam width for decoding. 1 (greedy) gives the lowest latency for "
+            "interactive dictation; larger beams can be slightly more accurate "
+            "but decode proportionally slower."
+        ),
+    )
+    vad_filter: bool = Field(
+        default=False,
+        description=(
+            "Run faster-whisper's built-in Silero VAD before decoding so silent "
+            "stretches (e.g. the pause before speaking or after finishing) are "
+            "skipped instead of transcribed. Shortens decode time for recordings "
+            "with a lot of silence."
+        ),
+    )
 
 
 class LiteLLMSTTRuntime(BaseModel):
@@ -283,6 +437,95 @@ class TranscribeConfig(BaseModel):
     )
 
 
+def _resolve_model_location(
+    runtime: LocalSTTRuntime, download_root: Optional[str]
+) -> tuple[str, str]:
+    """Return (model_path, models_dir) for a local runtime.
+
+    A model bundled with the app is used in place of the named model.
+    """
+    bundled_path = get_bundled_model_path(runtime.model)
+    model_path = str(bundled_path) if bundled_path else runtime.model
+    models_dir = download_root or str(get_app_data_dir() / "models")
+    return model_path, models_dir
+
+
+def preload_resident_models(stage_configs: list[dict]) -> None:
+    """Load resident (``keep_loaded``) local Whisper models ahead of first use.
+
+    A Transcribe stage only loads its model when its pipeline runs, so without
+    this the first hotkey press after startup pays the full load and warm-up
+    cost of a resident model. Intended to run on a background thread at
+    startup; models that aren't resident are skipped and errors are logged.
+
+    Args:
+        stage_configs: Transcribe stage configurations from enabled pipelines
+    """
+    for config in stage_configs:
+        runtime = None
+        try:
+            cfg = TranscribeConfig(**config)
+            runtime = cfg.runtime
+            if not isinstance(runtime, LocalSTTRuntime) or not _resolve_keep_loaded(
+                runtime.keep_loaded
+            ):
+                continue
+
+            logger.info(
+                "Preloading resident Whisper model '{}' on {} at startup...",
+                runtime.model,
+                runtime.device,
+            )
+            model_path, models_dir = _resolve_model_location(runtime, cfg.download_root)
+            _get_or_create_whisper_model(
+                model_path,
+                runtime.device,
+                _default_compute_type(runtime.device),
+                models_dir,
+                keep_loaded=True,
+            )
+        except Exception as e:
+            logger.warning("Resident Whisper model preload failed: {}", e)
+            if isinstance(runtime, LocalSTTRuntime) and runtime.device == "cuda":
+                _cuda_synchronize()
+
+
+# Library each runtime provider imports lazily on first use
+_PROVIDER_MODULES = {"local": "faster_whisper", "litellm": "litellm"}
+
+
+def preimport_runtime_modules(stage_configs: list[dict]) -> None:
+    """Import the STT libraries the configured runtimes use ahead of first use.
+
+    faster_whisper (CTranslate2) and litellm each take seconds to import, which
+    otherwise lands on the first hotkey press. Only the libraries for providers
+    that appear in ``stage_configs`` (primary or fallback runtimes) are
+    imported: litellm fetches its remote model cost map and holds a lot of
+    memory once imported, and faster_whisper is absent from cloud-only
+    installs. Intended to run on a background thread at startup.
+
+    Args:
+        stage_configs: Transcribe stage configurations from enabled pipelines
+    """
+    module_names: dict[str, None] = {}
+    for config in stage_configs:
+        try:
+            cfg = TranscribeConfig(**config)
+        except Exception as e:
+            logger.debug("Skipping pre-import for invalid Transcribe config: {}", e)
+            continue
+        for runtime in (cfg.runtime, *cfg.fallback_runtimes):
+            module_names.setdefault(_PROVIDER_MODULES[runtime.provider])
+
+    for module_name in module_names:
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            logger.info("Skipping pre-import of {}: {}", module_name, e)
+        except Exception as e:
+            logger.debug("Pre-import of {} failed: {}", module_name, e)
+
+
 @STAGE_REGISTRY.register
 class Transcribe(PipelineStage[Optional[str], Optional[str]]):
     """Transcribe audio file to text.
@@ -345,20 +588,24 @@ class Transcribe(PipelineStage[Optional[str], Optional[str]]):
         try:
             runtime = self.cfg.runtime
 
-            bundled_path = get_bundled_model_path(runtime.model)
-            model_path = str(bundled_path) if bundled_path else runtime.model
-            models_dir = self.cfg.download_root or str(get_app_data_dir() / "models")
-            compute_type = "float16" if runtime.device == "cuda" else "int8"
+            model_path, models_dir = _resolve_model_location(
+                runtime, self.cfg.download_root
+            )
+            compute_type = _default_compute_type(runtime.device)
             keep_loaded = _resolve_keep_loaded(runtime.keep_loaded)
 
             if keep_loaded:
                 logger.info(
-                    f"Loading resident Whisper model '{runtime.model}' on "
-                    f"{runtime.device} (kept loaded between requests)..."
+                    "Loading resident Whisper model '{}' on {} "
+                    "(kept loaded between requests)...",
+                    runtime.model,
+                    runtime.device,
                 )
             else:
                 logger.info(
-                    f"Preloading Whisper model '{runtime.model}' on {runtime.device}..."
+                    "Preloading Whisper model '{}' on {}...",
+                    runtime.model,
+                    runtime.device,
                 )
             self._preloaded_model = _get_or_create_whisper_model(
                 model_path,
@@ -369,7 +616,7 @@ class Transcribe(PipelineStage[Optional[str], Optional[str]]):
             )
             logger.info("Whisper model preload complete")
         except Exception as e:
-            logger.warning(f"Whisper model preload failed: {e}")
+            logger.warning("Whisper model preload failed: {}", e)
             self._preload_error = e
             if (
                 isinstance(self.cfg.runtime, LocalSTTRuntime)
@@ -401,11 +648,15 @@ class Transcribe(PipelineStage[Optional[str], Optional[str]]):
         del self._preloaded_model
         self._preloaded_model = None
 
-        # Force garbage collection so CTranslate2's C++ destructor runs
-        # immediately, releasing CUDA memory back to the GPU.
-        import gc
+        # Dropping the last reference already frees the model. On CUDA, also
+        # force a collection so CTranslate2's C++ destructor runs immediately,
+        # releasing VRAM back to the GPU. On CPU, skip the full stop-the-world
+        # collection: it runs on the pipeline thread before resources are
+        # released, delaying the next recording for no benefit.
+        if isinstance(runtime, LocalSTTRuntime) and runtime.device == "cuda":
+            import gc
 
-        gc.collect()
+            gc.collect()
 
     def _get_runtime_description(self, runtime: STTRuntime) -> str:
         """Get a human-readable description of a runtime configuration."""
@@ -422,6 +673,7 @@ class Transcribe(PipelineStage[Optional[str], Optional[str]]):
         runtime: LocalSTTRuntime,
         language: str = "en",
         download_root: Optional[str] = None,
+        recording: Optional["RecordedAudio"] = None,
     ) -> str:
         """Transcribe audio using a local Whisper runtime.
 
@@ -430,6 +682,8 @@ class Transcribe(PipelineStage[Optional[str], Optional[str]]):
             runtime: LocalSTTRuntime configuration to use
             language: Language code for transcription (default: "en")
             download_root: Directory where models are downloaded/cached
+            recording: In-memory samples of ``filename``, used instead of the
+                file when given
 
         Returns:
             str: Transcribed text with leading/trailing whitespace removed
@@ -449,14 +703,9 @@ class Transcribe(PipelineStage[Optional[str], Optional[str]]):
                 logger.warning("Preload failed, loading model inline")
 
         if whisper_model is None:
-            model = runtime.model
             device = runtime.device
-
-            bundled_path = get_bundled_model_path(model)
-            model_path = str(bundled_path) if bundled_path else model
-
-            models_dir = download_root or str(get_app_data_dir() / "models")
-            compute_type = "float16" if device == "cuda" else "int8"
+            model_path, models_dir = _resolve_model_location(runtime, download_root)
+            compute_type = _default_compute_type(device)
 
             try:
                 whisper_model = _get_or_create_whisper_model(
@@ -471,10 +720,26 @@ class Transcribe(PipelineStage[Optional[str], Optional[str]]):
                     _cuda_synchronize()
                 raise
 
-        # Transcribe the audio file
+        # Prefer the in-memory samples from RecordAudio over re-reading and
+        # decoding the WAV file, resampling them in memory if needed.
+        audio = filename
+        if recording is not None:
+            samples = recording.samples
+            try:
+                if recording.sample_rate != WHISPER_SAMPLE_RATE:
+                    samples = _resample_for_whisper(samples, recording.sample_rate)
+                audio = samples
+                logger.debug("Transcribing in-memory audio samples")
+            except Exception as e:
+                logger.debug("In-memory resample failed ({}), using audio file", e)
+                recording.ensure_file()
+
+        # Transcribe the audio
         segments, info = whisper_model.transcribe(
-            filename,
+            audio,
             language=language,
+            beam_size=runtime.beam_size,
+            vad_filter=runtime.vad_filter,
         )
 
         # Combine all segments into a single text
@@ -488,6 +753,7 @@ class Transcribe(PipelineStage[Optional[str], Optional[str]]):
         filename: str,
         runtime: LiteLLMSTTRuntime,
         language: str = "en",
+        recording: Optional["RecordedAudio"] = None,
     ) -> str:
         """Transcribe audio using LiteLLM API runtime.
 
@@ -497,6 +763,7 @@ class Transcribe(PipelineStage[Optional[str], Optional[str]]):
             filename: Path to the audio file to transcribe
             runtime: LiteLLMSTTRuntime configuration to use
             language: Language code for transcription
+            recording: In-memory samples of ``filename``, if available
 
         Returns:
             str: Transcribed text
@@ -510,20 +777,30 @@ class Transcribe(PipelineStage[Optional[str], Optional[str]]):
                 "Please set it to use the litellm provider."
             )
 
-        if not filename or not os.path.exists(filename):
+        # RecordAudio may have kept the recording in memory only
+        if recording is not None:
+            recording.ensure_file()
+
+        # A single stat both validates the path and gives the size
+        try:
+            file_size = os.stat(filename).st_size if filename else None
+        except OSError:
+            file_size = None
+        if file_size is None:
             raise TranscriptionError(f"Audio file not found or invalid: {filename}")
 
-        logger.debug(f"Transcribing {filename} with LiteLLM...")
+        logger.debug("Transcribing {} with LiteLLM...", filename)
         final_filename = filename
         use_audio_format = self.audio_format
         converted_file: Optional[str] = None
 
-        # Check file size and convert if too large and format is wav
-        file_size = Path(filename).stat().st_size
-        if file_size > 24.9 * 1024 * 1024 and self.audio_format == "wav":
+        # Convert if too large and format is wav
+        if file_size > MAX_UPLOAD_BYTES and self.audio_format == "wav":
             logger.debug(
-                f"Warning: {filename} ({file_size / (1024 * 1024):.1f} MB) "
-                f"may be too large for some APIs, converting to mp3."
+                "Warning: {} ({:.1f} MB) "
+                "may be too large for some APIs, converting to mp3.",
+                filename,
+                file_size / (1024 * 1024),
             )
             use_audio_format = "mp3"
 
@@ -535,29 +812,38 @@ class Transcribe(PipelineStage[Optional[str], Optional[str]]):
                     delete=False,
                 ) as tmp_file:
                     converted_file = tmp_file.name
-                logger.debug(f"Converting {filename} to {use_audio_format}...")
-                audio = AudioSegment.from_wav(filename)
-                audio.export(converted_file, format=use_audio_format)
-                logger.debug(f"Conversion successful: {converted_file}")
+                logger.debug("Converting {} to {}...", filename, use_audio_format)
+                _convert_audio_file(
+                    filename, converted_file, use_audio_format, recording
+                )
+                logger.debug("Conversion successful: {}", converted_file)
                 final_filename = converted_file
-            except (CouldntDecodeError, CouldntEncodeError) as e:
+            except (
+                CouldntDecodeError,
+                CouldntEncodeError,
+                subprocess.CalledProcessError,
+            ) as e:
                 logger.debug(
-                    f"Error converting audio to {use_audio_format}: {e}. "
-                    f"Will attempt transcription with original WAV."
+                    "Error converting audio to {}: {}. "
+                    "Will attempt transcription with original WAV.",
+                    use_audio_format,
+                    e,
                 )
                 final_filename = filename
                 converted_file = None
             except (OSError, FileNotFoundError) as e:
                 logger.debug(
-                    f"File system error during conversion: {e}. "
-                    f"Will attempt transcription with original WAV."
+                    "File system error during conversion: {}. "
+                    "Will attempt transcription with original WAV.",
+                    e,
                 )
                 final_filename = filename
                 converted_file = None
             except Exception as e:
                 logger.debug(
-                    f"Unexpected error during audio conversion: {e}. "
-                    f"Will attempt transcription with original WAV."
+                    "Unexpected error during audio conversion: {}. "
+                    "Will attempt transcription with original WAV.",
+                    e,
                 )
                 final_filename = filename
                 converted_file = None
@@ -580,13 +866,17 @@ class Transcribe(PipelineStage[Optional[str], Optional[str]]):
             # Cleanup converted file if we created one
             if converted_file:
                 try:
-                    Path(converted_file).unlink(missing_ok=True)
+                    os.unlink(converted_file)
                     logger.debug(
-                        f"Cleaned up temporary converted file: {converted_file}"
+                        "Cleaned up temporary converted file: {}", converted_file
                     )
+                except FileNotFoundError:
+                    pass
                 except OSError as e:
                     logger.debug(
-                        f"Warning: Could not remove temporary converted file {converted_file}: {e}"
+                        "Warning: Could not remove temporary converted file {}: {}",
+                        converted_file,
+                        e,
                     )
 
         return transcript_text.strip() if transcript_text else ""
@@ -595,6 +885,7 @@ class Transcribe(PipelineStage[Optional[str], Optional[str]]):
         self,
         filename: str,
         runtime: STTRuntime,
+        recording: Optional["RecordedAudio"] = None,
     ) -> str:
         """Transcribe audio using a single runtime configuration.
 
@@ -603,6 +894,7 @@ class Transcribe(PipelineStage[Optional[str], Optional[str]]):
         Args:
             filename: Path to audio file
             runtime: STTRuntime configuration (LocalSTTRuntime or LiteLLMSTTRuntime)
+            recording: In-memory samples of ``filename``, if available
 
         Returns:
             str: Transcribed text
@@ -616,17 +908,21 @@ class Transcribe(PipelineStage[Optional[str], Optional[str]]):
                 runtime=runtime,
                 language=self.cfg.language,
                 download_root=self.cfg.download_root,
+                recording=recording,
             )
         elif isinstance(runtime, LiteLLMSTTRuntime):
             return self._transcribe_with_litellm_runtime(
                 filename=filename,
                 runtime=runtime,
                 language=self.cfg.language,
+                recording=recording,
             )
         else:
             raise TranscriptionError(f"Unknown runtime type: {type(runtime).__name__}")
 
-    def _transcribe_with_fallbacks(self, filename: str) -> str:
+    def _transcribe_with_fallbacks(
+        self, filename: str, recording: Optional["RecordedAudio"] = None
+    ) -> str:
         """Transcribe audio with fallback support across all runtime types.
 
         Attempts transcription with the primary runtime first. If it fails, tries each
@@ -634,6 +930,7 @@ class Transcribe(PipelineStage[Optional[str], Optional[str]]):
 
         Args:
             filename: Path to audio file
+            recording: In-memory samples of ``filename``, if available
 
         Returns:
             str: Transcribed text
@@ -649,19 +946,19 @@ class Transcribe(PipelineStage[Optional[str], Optional[str]]):
             is_fallback = i > 0
 
             if is_fallback:
-                logger.info(f"Trying fallback runtime {i}: {runtime_desc}")
+                logger.info("Trying fallback runtime {}: {}", i, runtime_desc)
             else:
-                logger.info(f"Trying primary runtime: {runtime_desc}")
+                logger.info("Trying primary runtime: {}", runtime_desc)
 
             try:
-                result = self._transcribe_single_runtime(filename, runtime)
+                result = self._transcribe_single_runtime(filename, runtime, recording)
                 if is_fallback:
-                    logger.info(f"Fallback runtime {i} succeeded: {runtime_desc}")
+                    logger.info("Fallback runtime {} succeeded: {}", i, runtime_desc)
                 return result
             except Exception as e:
                 last_error = e
                 logger.warning(
-                    f"Runtime failed ({runtime_desc}): {type(e).__name__}: {e}"
+                    "Runtime failed ({}): {}: {}", runtime_desc, type(e).__name__, e
                 )
                 continue
 
@@ -692,16 +989,21 @@ class Transcribe(PipelineStage[Optional[str], Optional[str]]):
 
         # Update icon to processing state
         context.icon_controller.set_icon("processing")
-        logger.debug(f"Transcribing audio file: {input_data}")
+        logger.debug("Transcribing audio file: {}", input_data)
+
+        # Use the samples RecordAudio kept in memory if they belong to this file
+        recording = context.recorded_audio
+        if recording is not None and recording.path != input_data:
+            recording = None
 
         # Transcribe with fallback support
-        text = self._transcribe_with_fallbacks(input_data)
+        text = self._transcribe_with_fallbacks(input_data, recording)
 
         # Replace multiple spaces with single space
         text = " ".join(text.split())
 
         if text:
-            logger.info(f"Transcription result: {text}")
+            logger.info("Transcription result: {}", text)
         else:
             logger.warning("Transcription returned no text")
 
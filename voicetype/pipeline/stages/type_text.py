@@ -90,7 +90,7 @@ class TypeText(PipelineStage[Optional[str], None]):
             logger.info("No text to type (input is None)")
             return
 
-        logger.debug(f"Typing text: {input_data}")
+        logger.debug("Typing text: {}", input_data)
 
         self.backend.type_text(input_data)
 
@@ -6,7 +6,7 @@ a uniform interface for waiting for trigger completion.
 
 import threading
 import time
-from typing import Optional
+from typing import Callable, Optional
 
 
 class TriggerEvent:
@@ -23,6 +23,20 @@ class TriggerEvent:
         """
         raise NotImplementedError
 
+    def interrupt(self):
+        """Wake any thread blocked in wait_for_completion() early.
+
+        Called by the executor when the pipeline is cancelled, so a stage
+        waiting on the trigger notices the cancellation immediately.
+        """
+
+    def pipeline_finished(self):
+        """Notify the trigger that the pipeline using it has ended.
+
+        Called by the executor once the pipeline finishes, fails or is
+        cancelled, so whoever created the trigger can stop tracking it.
+        """
+
 
 class HotkeyTriggerEvent(TriggerEvent):
     """Hotkey-specific trigger that waits for key release.
@@ -31,10 +45,16 @@ class HotkeyTriggerEvent(TriggerEvent):
     the key is released. Used for press-and-hold style interactions.
     """
 
-    def __init__(self):
-        """Initialize a new hotkey trigger event."""
+    def __init__(self, on_finished: Optional[Callable[[], None]] = None):
+        """Initialize a new hotkey trigger event.
+
+        Args:
+            on_finished: Optional callback run when the pipeline using this
+                trigger ends, whether or not the key release was seen
+        """
         self.press_time = time.time()
         self.release_event = threading.Event()
+        self._on_finished = on_finished
 
     def wait_for_completion(self, timeout: Optional[float] = None) -> bool:
         """Block until key is released or timeout.
@@ -54,6 +74,15 @@ class HotkeyTriggerEvent(TriggerEvent):
         """
         self.release_event.set()
 
+    def interrupt(self):
+        """Wake the waiter as if the key had been released."""
+        self.release_event.set()
+
+    def pipeline_finished(self):
+        """Run the on_finished callback, if one was given."""
+        if self._on_finished is not None:
+            self._on_finished()
+
 
 class TimerTriggerEvent(TriggerEvent):
     """Timer-based trigger that waits for fixed duration.
@@ -69,6 +98,7 @@ class TimerTriggerEvent(TriggerEvent):
             duration: Duration to wait in seconds
         """
         self.duration = duration
+        self._interrupted = threading.Event()
 
     def wait_for_completion(self, timeout: Optional[float] = None) -> bool:
         """Wait for configured duration (or timeout, whichever is less).
@@ -77,14 +107,18 @@ class TimerTriggerEvent(TriggerEvent):
             timeout: Maximum time to wait in seconds, or None for no timeout
 
         Returns:
-            True (always completes successfully unless interrupted)
+            True (always completes successfully, including when interrupted)
         """
         wait_time = self.duration
         if timeout is not None:
             wait_time = min(self.duration, timeout)
-        time.sleep(wait_time)
+        self._interrupted.wait(wait_time)
         return True
 
+    def interrupt(self):
+        """End the wait before the duration elapses."""
+        self._interrupted.set()
+
 
 class ProgrammaticTriggerEvent(TriggerEvent):
     """Programmatic trigger with no automatic completion.
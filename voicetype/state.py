@@ -21,6 +21,8 @@ class AppState:
     Thread-safe state management for the application.
     """
 
+    __slots__ = ("_state", "_lock")
+
     def __init__(self):
         self._state = State.DISABLED
         self._lock = threading.Lock()
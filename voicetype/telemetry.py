@@ -100,6 +100,9 @@ class OTLPJSONFileExporter(SpanExporter):
                 or self.file_handle.closed
             ):
                 self._open_file()
+
+            # Serialize the whole batch, then write and flush once
+            lines = []
             for span in spans:
                 # Convert span to OTLP-compatible JSON format
                 span_data = {
@@ -155,10 +158,11 @@ class OTLPJSONFileExporter(SpanExporter):
                     },
                 }
 
-                # Write as single line JSON (JSONL format)
-                json_line = json.dumps(span_data, default=str)
-                self.file_handle.write(json_line + "\n")
-                self.file_handle.flush()
+                # Single line JSON (JSONL format)
+                lines.append(json.dumps(span_data, default=str) + "\n")
+
+            self.file_handle.write("".join(lines))
+            self.file_handle.flush()
 
             return SpanExportResult.SUCCESS
         except Exception as e:
@@ -110,9 +110,6 @@ def _quit(icon: pystray._base.Icon, item: Item):
 
 def _restart(icon: pystray._base.Icon, item: Item):
     """Restart the VoiceType application to reload configuration."""
-    import os
-    import sys
-
     # Stop the tray icon first
     icon.stop()
 
@@ -475,9 +472,13 @@ class TrayIconController:
             icon: The pystray.Icon instance to control
         """
         self.icon = icon
-        self._flashing = False
+        # Pipelines on different threads can start/stop flashing concurrently.
+        # Each flash loop gets its own stop Event (set == not flashing), so a
+        # stale loop can never be revived by a later start_flashing().
+        self._flash_lock = threading.Lock()
         self._flash_thread: Optional[threading.Thread] = None
         self._stop_flash = threading.Event()
+        self._stop_flash.set()
 
     def set_icon(self, state: str, duration: Optional[float] = None) -> None:
         """Set the system tray icon to a specific state.
@@ -487,7 +488,7 @@ class TrayIconController:
             duration: Optional duration in seconds before reverting (not implemented)
         """
         # Stop any flashing when explicitly setting icon
-        if self._flashing:
+        if not self._stop_flash.is_set():
             self.stop_flashing()
 
         try:
@@ -521,16 +522,12 @@ class TrayIconController:
         Args:
             state: Icon state to flash (e.g., "recording")
         """
-        if self._flashing:
-            self.stop_flashing()
-
-        self._flashing = True
-        self._stop_flash.clear()
+        stop_flash = threading.Event()
 
         def flash_loop():
             """Toggle between state and dimmed version."""
             visible = True
-            while not self._stop_flash.is_set():
+            while not stop_flash.is_set():
                 try:
                     if state == "recording":
                         if visible:
@@ -564,21 +561,43 @@ class TrayIconController:
                         pass
 
                     visible = not visible
-                    self._stop_flash.wait(0.5)  # Flash every 0.5 seconds
+                    stop_flash.wait(0.5)  # Flash every 0.5 seconds
                 except Exception:
                     break
 
-        self._flash_thread = threading.Thread(target=flash_loop, daemon=True)
-        self._flash_thread.start()
+        flash_thread = threading.Thread(target=flash_loop, daemon=True)
+        # Swap in the new loop and stop the previous one in a single critical
+        # section, so concurrent callers can't both replace the same old loop
+        # and leave one of their own running with no reference to its Event.
+        with self._flash_lock:
+            prev_stop, prev_thread = self._stop_flash, self._flash_thread
+            self._stop_flash = stop_flash
+            self._flash_thread = flash_thread
+            prev_stop.set()
+        self._join_flash_thread(prev_thread)
+        flash_thread.start()
 
     def stop_flashing(self) -> None:
         """Stop flashing and return to the current non-flashing state."""
-        if self._flashing:
-            self._flashing = False
-            self._stop_flash.set()
-            if self._flash_thread:
-                self._flash_thread.join(timeout=1.0)
-                self._flash_thread = None
+        with self._flash_lock:
+            stop_flash, flash_thread = self._stop_flash, self._flash_thread
+            self._flash_thread = None
+        stop_flash.set()
+        self._join_flash_thread(flash_thread)
+
+    @staticmethod
+    def _join_flash_thread(flash_thread: Optional[threading.Thread]) -> None:
+        """Wait for a stopped flash loop to exit.
+
+        A loop another caller has installed but not started yet is skipped: its
+        Event is already set, so it exits without touching the icon once started.
+        """
+        if (
+            flash_thread is not None
+            and flash_thread is not threading.current_thread()
+            and flash_thread.is_alive()
+        ):
+            flash_thread.join(timeout=1.0)
 
 
 def create_tray(ctx: AppContext) -> pystray.Icon:
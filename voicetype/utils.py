@@ -1,7 +1,11 @@
+import functools
 import os
+import queue
 import sys
+import threading
 import time
 from pathlib import Path
+from typing import Optional
 
 from loguru import logger
 
@@ -40,29 +44,109 @@ def type_text(text):
     keyboard.release("\n")
 
 
-def play_sound(sound_path):
-    """Play a sound file using playsound3 with threading to avoid blocking.
+# Sounds are played by a single long-lived worker thread fed from a queue,
+# rather than spawning a new thread for every hotkey press. The worker blocks in
+# ``get()`` with no polling timeout, so it only wakes when there is work. ``None``
+# is the shutdown sentinel.
+_sound_queue: "queue.SimpleQueue[Optional[str | Path]]" = queue.SimpleQueue()
+_sound_worker: Optional[threading.Thread] = None
+_sound_worker_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_sound(sound_file: Path):
+    """Decode a sound file once and keep its samples in memory.
 
     Args:
-        sound_path: Path to the sound file to play
+        sound_file: Path to the sound file
 
+    Returns:
+        Tuple of (float32 samples, sample rate)
     """
-    import threading
-    from pathlib import Path
+    import soundfile as sf
+
+    return sf.read(str(sound_file), dtype="float32")
+
+
+def preload_sounds(*sound_paths):
+    """Decode sound files ahead of time so their first playback starts instantly.
 
-    def _play_sound_thread():
+    Failures are logged and ignored; playback falls back to decoding (or
+    playsound3) on demand.
+
+    Args:
+        *sound_paths: Paths to the sound files to decode
+    """
+    for sound_path in sound_paths:
         try:
-            from playsound3 import playsound
+            _load_sound(Path(sound_path))
+        except Exception as e:
+            logger.debug("Could not pre-decode sound {}: {}", sound_path, e)
 
-            sound_file = Path(sound_path)
-            if not sound_file.exists():
-                logger.warning(f"Sound file does not exist: {sound_file}")
-                return
 
-            logger.debug(f"Playing sound: {sound_file}")
-            playsound(str(sound_file), block=True)
+def _play_sound_file(sound_file: Path):
+    """Play a sound from its cached samples, blocking until it finishes.
+
+    Playback goes to PortAudio's default output device, so on PulseAudio or
+    PipeWire the cue is a stream of this process rather than of an external
+    player, and per-application output routing applies to it as such. Falls
+    back to playsound3 (the platform's own player) if in-memory playback
+    isn't possible, e.g. no PortAudio output device is available.
+    """
+    try:
+        import sounddevice as sd
+
+        data, samplerate = _load_sound(sound_file)
+        if len(data):
+            sd.play(data, samplerate, blocking=True)
+        return
+    except Exception as e:
+        logger.debug("In-memory playback failed ({}), falling back to playsound3", e)
+
+    if not sound_file.exists():
+        logger.warning("Sound file does not exist: {}", sound_file)
+        return
+
+    from playsound3 import playsound
+
+    playsound(str(sound_file), block=True)
+
+
+def _sound_worker_loop():
+    """Play queued sounds one at a time until the shutdown sentinel arrives."""
+    while (sound_path := _sound_queue.get()) is not None:
+        try:
+            sound_file = Path(sound_path)
+            logger.debug("Playing sound: {}", sound_file)
+            _play_sound_file(sound_file)
         except Exception as e:
-            logger.error(f"Failed to play sound {sound_path}: {e}")
+            logger.error("Failed to play sound {}: {}", sound_path, e)
+
 
-    # Each sound gets its own thread - simpler and more reliable
-    threading.Thread(target=_play_sound_thread, daemon=True).start()
+def play_sound(sound_path):
+    """Play a sound file without blocking the caller.
+
+    The sound is handed to a persistent background worker, which is started
+    on first use. Each file is decoded once and then played from memory.
+
+    Args:
+        sound_path: Path to the sound file to play
+
+    """
+    global _sound_worker
+    with _sound_worker_lock:
+        if _sound_worker is None or not _sound_worker.is_alive():
+            _sound_worker = threading.Thread(
+                target=_sound_worker_loop, daemon=True, name="sound-worker"
+            )
+            _sound_worker.start()
+    _sound_queue.put(sound_path)
+
+
+def shutdown_sound_worker():
+    """Ask the sound worker to exit once any queued sounds have played."""
+    global _sound_worker
+    with _sound_worker_lock:
+        if _sound_worker is not None and _sound_worker.is_alive():
+            _sound_queue.put(None)
+        _sound_worker = None